@@ -7,7 +7,7 @@ Run this script to see the thinking box in action:
 """
 import asyncio
 
-from thinking_prompt import ThinkingPromptSession, AppInfo
+from thinking_prompt import ThinkingPromptSession, AppInfo, StreamingContent
 
 
 async def main():
@@ -25,26 +25,23 @@ async def main():
         if not text.strip():
             return
 
-        # Use a list for O(1) append
-        chunks = []
-
-        def get_content():
-            return ''.join(chunks)
+        # StreamingContent keeps the joined text between appends for repaints
+        content = StreamingContent()
 
         # Start thinking mode with content callback
-        session.start_thinking(get_content)
+        session.start_thinking(content.get_content)
 
         # Update thinking box with streaming content
-        chunks.append("Processing your input...\n")
+        content.append("Processing your input...\n")
         await asyncio.sleep(0.3)
 
         # Simulate token-by-token processing
         words = text.split()
         for i, word in enumerate(words):
-            chunks.append(f"  Token {i + 1}: {word}\n")
+            content.append(f"  Token {i + 1}: {word}\n")
             await asyncio.sleep(0.15)
 
-        chunks.append("\nAnalysis complete!\n")
+        content.append("\nAnalysis complete!\n")
         await asyncio.sleep(0.5)
 
         # Finish thinking - content moves to console
@@ -14,7 +14,7 @@ Run:
 """
 import asyncio
 
-from thinking_prompt import ThinkingPromptSession, AppInfo
+from thinking_prompt import ThinkingPromptSession, AppInfo, StreamingContent
 
 
 async def main():
@@ -32,21 +32,18 @@ async def main():
         if not user_input.strip():
             return
 
-        # Use a list for O(1) append
-        chunks = []
-
-        def get_content():
-            return ''.join(chunks)
+        # StreamingContent keeps the joined text between appends for repaints
+        content = StreamingContent()
 
         # Start thinking mode
-        session.start_thinking(get_content)
+        session.start_thinking(content.get_content)
 
         # Phase 1: Initial analysis
-        chunks.append("Analyzing your input...\n")
+        content.append("Analyzing your input...\n")
         await asyncio.sleep(0.4)
 
         # Phase 2: Show what we're processing
-        chunks.append(f"Received: \"{user_input}\"\n")
+        content.append(f"Received: \"{user_input}\"\n")
         await asyncio.sleep(0.3)
 
         # Phase 3: Simulated reasoning steps (more than max_thinking_height to show truncation)
@@ -62,11 +59,11 @@ async def main():
         ]
 
         for step in steps:
-            chunks.append(f"  {step}\n")
+            content.append(f"  {step}\n")
             await asyncio.sleep(0.3)
 
         # Phase 4: Done
-        chunks.append("\nDone.\n")
+        content.append("\nDone.\n")
         await asyncio.sleep(0.3)
 
         # Finish thinking - adds thinking content to history
@@ -11,45 +11,86 @@ Run:
     python examples/completer_demo.py
 """
 import asyncio
+from bisect import bisect_left
+from collections.abc import Sequence
+from functools import lru_cache
 
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.document import Document
 
 from thinking_prompt import ThinkingPromptSession, AppInfo
 
+HELP_TEXT = (
+    "## Available Commands\n\n"
+    "- **/help** - Show this help message\n"
+    "- **/settings** - Open settings dialog\n"
+    "- **/clear** - Clear the screen\n"
+    "- **/history** - Show command history\n"
+    "- **/export** - Export data\n"
+    "- **/import** - Import data\n"
+    "- **/quit** - Exit the application\n"
+    "- **/version** - Show version info\n"
+    "- **/status** - Show current status\n"
+    "- **/refresh** - Refresh data\n"
+)
+VERSION_TEXT = "CompleterDemo v1.0.0"
+
 
 class SlashCommandCompleter(Completer):
     """Completer that only triggers for slash commands."""
 
-    def __init__(self, commands: list[str]):
+    def __init__(self, commands: Sequence[str], *, presorted: bool = False):
         """
         Initialize with a list of command names (without leading slash).
 
         Args:
-            commands: List of command names, e.g., ["help", "settings", "quit"]
+            commands: Command names, e.g., ["help", "settings", "quit"]
+            presorted: Set if commands are already sorted case-insensitively,
+                to store them as given instead of sorting a copy.
         """
-        self.commands = sorted(commands)
+        self.commands = commands if presorted else sorted(commands, key=str.lower)
+        # Lowercased names (sorted, for bisect) and completion text computed
+        # once, not per keystroke
+        self._keys = [cmd.lower() for cmd in self.commands]
+        self._texts = [f"/{cmd}" for cmd in self.commands]
 
     def get_completions(self, document: Document, complete_event):
         """Yield completions only when text starts with /."""
         text = document.text_before_cursor
 
-        # Only complete if input starts with /
-        if not text.startswith("/"):
+        # Only complete if input starts with / (checked by index since this
+        # runs on every keystroke and most input is plain text)
+        if not text or text[0] != "/":
             return
 
         # Get the partial command (without the leading /)
         partial = text[1:].lower()
-
-        # Find matching commands
-        for cmd in self.commands:
-            if cmd.lower().startswith(partial):
-                # Calculate how much to complete (replace everything after /)
-                yield Completion(
-                    text=f"/{cmd}",
-                    start_position=-len(text),
-                    display=f"/{cmd}",
-                )
+        # Replace everything typed so far, including the /
+        start_position = -len(text)
+
+        # Matches form a contiguous run in the sorted keys starting at the
+        # first key >= partial
+        keys = self._keys
+        i = bisect_left(keys, partial)
+        while i < len(keys) and keys[i].startswith(partial):
+            yield Completion(
+                text=self._texts[i],
+                start_position=start_position,
+                display=self._texts[i],
+            )
+            i += 1
+
+
+@lru_cache(maxsize=None)
+def make_slash_completer(commands: tuple[str, ...]) -> SlashCommandCompleter:
+    """
+    Return a shared completer for the given commands.
+
+    The completer holds no per-session state, so sessions using the same
+    command set can reuse one instance and its precomputed lookup tables.
+    The commands are sorted here, once per distinct command set.
+    """
+    return SlashCommandCompleter(tuple(sorted(commands, key=str.lower)), presorted=True)
 
 
 async def main():
@@ -67,7 +108,7 @@ async def main():
         "refresh",
     ]
 
-    completer = SlashCommandCompleter(commands)
+    completer = make_slash_completer(tuple(commands))
 
     app_info = AppInfo(
         name="CompleterDemo",
@@ -89,30 +130,16 @@ async def main():
     @session.on_input
     async def handle(text: str):
         """Handle user input."""
-        if not text.strip():
-            return
-
         text = text.strip()
+        if not text:
+            return
 
         # Handle slash commands
         if text.startswith("/"):
             cmd = text[1:].lower()
 
             if cmd == "help":
-                session.add_response(
-                    "## Available Commands\n\n"
-                    "- **/help** - Show this help message\n"
-                    "- **/settings** - Open settings dialog\n"
-                    "- **/clear** - Clear the screen\n"
-                    "- **/history** - Show command history\n"
-                    "- **/export** - Export data\n"
-                    "- **/import** - Import data\n"
-                    "- **/quit** - Exit the application\n"
-                    "- **/version** - Show version info\n"
-                    "- **/status** - Show current status\n"
-                    "- **/refresh** - Refresh data\n",
-                    markdown=True
-                )
+                session.add_response(HELP_TEXT, markdown=True)
                 return
 
             if cmd == "quit":
@@ -120,7 +147,7 @@ async def main():
                 raise KeyboardInterrupt
 
             if cmd == "version":
-                session.add_response("CompleterDemo v1.0.0")
+                session.add_response(VERSION_TEXT)
                 return
 
             if cmd == "clear":
@@ -136,11 +163,7 @@ async def main():
             else:
                 session.add_response(f"Unknown command: /{cmd}. Type '/help' for available commands.")
         else:
-            # Regular text input - echo it back
-            async with session.thinking() as content:
-                content.append("Processing your message...\n")
-                await asyncio.sleep(0.3)
-                content.append("Done!\n")
+            # Regular text input - echo it back (no work to show, so no thinking box)
             session.add_response(f"You said: {text}")
 
     await session.run_async()
@@ -11,7 +11,7 @@ Run:
 """
 import asyncio
 
-from thinking_prompt import ThinkingPromptSession, AppInfo
+from thinking_prompt import ThinkingPromptSession, AppInfo, StreamingContent
 
 
 async def main():
@@ -28,20 +28,17 @@ async def main():
         if not user_input.strip():
             return
 
-        # Use a list for O(1) append
-        chunks = []
-
-        def get_content():
-            return ''.join(chunks)
+        # StreamingContent keeps the joined text between appends for repaints
+        content = StreamingContent()
 
         # Start thinking mode
-        session.start_thinking(get_content)
+        session.start_thinking(content.get_content)
 
         # Update thinking box in real-time
-        chunks.append("Analyzing your input...\n")
+        content.append("Analyzing your input...\n")
         await asyncio.sleep(0.4)
 
-        chunks.append(f"Input received: \"{user_input}\"\n\n")
+        content.append(f"Input received: \"{user_input}\"\n\n")
         await asyncio.sleep(0.3)
 
         # Simulated reasoning steps
@@ -52,20 +49,20 @@ async def main():
         ]
 
         for step in steps:
-            chunks.append(f"{step}\n")
+            content.append(f"{step}\n")
             await asyncio.sleep(0.5)
 
         # Stream the "response" character by character
-        chunks.append("\nResponse: ")
+        content.append("\nResponse: ")
         await asyncio.sleep(0.2)
 
         preview = user_input[:30] + ('...' if len(user_input) > 30 else '')
         response = f"I understood your message about '{preview}'"
         for char in response:
-            chunks.append(char)
+            content.append(char)
             await asyncio.sleep(0.03)
 
-        chunks.append("\n")
+        content.append("\n")
         await asyncio.sleep(0.3)
 
         # Finish - content is printed to console (if not in fullscreen)
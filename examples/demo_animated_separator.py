@@ -95,10 +95,12 @@ async def main():
             return
 
         if cmd == "list":
-            session.add_message("system", "Available animation configs:")
+            # One message (and one redraw) for the whole list
+            lines = ["Available animation configs:"]
             for i, cfg in enumerate(configs):
                 marker = "→ " if i == current_config_idx[0] else "  "
-                session.add_message("system", f"  {marker}{i+1}. {cfg['name']}")
+                lines.append(f"  {marker}{i+1}. {cfg['name']}")
+            session.add_message("system", "\n".join(lines))
             return
 
         if not cmd:
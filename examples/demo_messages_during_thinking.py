@@ -33,6 +33,9 @@ async def main():
         if not user_input.strip():
             return
 
+        input_length = len(user_input)
+        quote = user_input[:60] + ("..." if input_length > 60 else "")
+
         # Use the context manager for clean thinking management
         async with session.thinking() as content:
             # Initial thinking content
@@ -56,14 +59,14 @@ async def main():
             # Output markdown content during thinking
             session.add_response(
                 "## Processing Details\n"
-                "- Input length: **{} chars**\n"
-                "- Mode: `standard`\n".format(len(user_input)),
+                f"- Input length: **{input_length} chars**\n"
+                "- Mode: `standard`\n",
                 markdown=True
             )
             await asyncio.sleep(0.4)
 
             # Simulate a warning condition
-            if len(user_input) > 50:
+            if input_length > 50:
                 session.add_warning("Input exceeds recommended length")
                 content.append("  (using truncated analysis)\n")
             await asyncio.sleep(0.3)
@@ -87,18 +90,20 @@ async def main():
             content.append("\nAnalysis complete!\n")
             await asyncio.sleep(0.2)
 
-        # After thinking finishes, add the final response with markdown
-        session.add_success("All operations completed successfully")
-
-        # Final markdown response
-        session.add_response(
-            "### Result\n\n"
-            f"> {user_input[:60]}{'...' if len(user_input) > 60 else ''}\n\n"
-            "**Status:** Complete\n\n"
-            "---\n"
-            "*Thank you for using MessagesDemo!*",
-            markdown=True
-        )
+        # After thinking finishes, add the final response with markdown.
+        # batch() redraws once for both messages instead of once per message.
+        with session.batch():
+            session.add_success("All operations completed successfully")
+
+            # Final markdown response
+            session.add_response(
+                "### Result\n\n"
+                f"> {quote}\n\n"
+                "**Status:** Complete\n\n"
+                "---\n"
+                "*Thank you for using MessagesDemo!*",
+                markdown=True
+            )
 
     # Run the session
     await session.run_async()
@@ -12,10 +12,22 @@ Run:
     python examples/demo_progress_line.py
 """
 import asyncio
-import threading
+from typing import Optional, Tuple
 
 from thinking_prompt import ThinkingPromptSession, AppInfo
 
+# Progress bars and spinner lines only take a handful of distinct values,
+# so build them once instead of formatting them on every frame.
+BAR_WIDTH = 20
+PROGRESS_BARS = tuple("█" * k + "░" * (BAR_WIDTH - k) for k in range(BAR_WIDTH + 1))
+SPINNER_FRAMES = ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")
+SPINNER_LINES = tuple(f"  {frame} Validating integrity..." for frame in SPINNER_FRAMES)
+
+
+def progress_bar(done: int, total: int) -> str:
+    """Return the bar for ``done`` of ``total`` steps (a table lookup for any total)."""
+    return PROGRESS_BARS[done * BAR_WIDTH // total]
+
 
 class ProgressContent:
     """
@@ -23,55 +35,95 @@ class ProgressContent:
 
     Maintains completed lines and a current "progress" line that
     can be updated without creating new lines.
+
+    Mutators run on the event loop and publish a new
+    ``(joined_lines, progress_line)`` tuple with a single attribute
+    assignment, so ``get_content`` can read a consistent snapshot
+    without taking a lock on every render. ``joined_lines`` is None
+    until the first line is added, which keeps an empty first line
+    distinct from no lines at all.
     """
 
     def __init__(self):
-        self._lines: list[str] = []
-        self._progress_line: str = ""
-        self._lock = threading.Lock()
+        # Completed lines are kept pre-joined so rendering doesn't re-join
+        # the whole history on every frame.
+        self._state: Tuple[Optional[str], str] = (None, "")
+
+    @staticmethod
+    def _with_line(joined: Optional[str], text: str) -> str:
+        """Return ``joined`` with ``text`` appended as a new line."""
+        if joined is None:
+            return text
+        return joined + "\n" + text
 
     def add_line(self, text: str) -> None:
         """Add a completed line (with newline)."""
-        with self._lock:
-            # If there was a progress line, finalize it first
-            if self._progress_line:
-                self._lines.append(self._progress_line)
-                self._progress_line = ""
-            self._lines.append(text)
+        joined, progress = self._state
+        # If there was a progress line, finalize it first
+        if progress:
+            joined = self._with_line(joined, progress)
+        self._state = (self._with_line(joined, text), "")
 
     def set_progress(self, text: str) -> None:
         """Set the current progress line (updates in place)."""
-        with self._lock:
-            self._progress_line = text
+        self._state = (self._state[0], text)
 
     def clear_progress(self) -> None:
         """Clear the progress line without adding it to lines."""
-        with self._lock:
-            self._progress_line = ""
+        self._state = (self._state[0], "")
 
     def finalize_progress(self) -> None:
         """Move progress line to completed lines."""
-        with self._lock:
-            if self._progress_line:
-                self._lines.append(self._progress_line)
-                self._progress_line = ""
+        joined, progress = self._state
+        if progress:
+            self._state = (self._with_line(joined, progress), "")
 
     def get_content(self) -> str:
         """Get the full content for display."""
-        with self._lock:
-            result = "\n".join(self._lines)
-            if self._progress_line:
-                if result:
-                    result += "\n" + self._progress_line
-                else:
-                    result = self._progress_line
-            return result
+        joined, progress = self._state
+        if not progress:
+            return joined or ""
+        return self._with_line(joined, progress)
 
     def clear(self) -> None:
         """Clear all content."""
-        with self._lock:
-            self._lines.clear()
-            self._progress_line = ""
+        self._state = (None, "")
+
+
+async def animate_progress(content: ProgressContent, frames, interval: float) -> None:
+    """
+    Show each frame as the progress line, one every ``interval`` seconds.
+
+    Frames are scheduled with ``loop.call_at`` against fixed deadlines on
+    the loop clock, so each tick costs a single timer handle rather than a
+    sleep coroutine, timer overhead doesn't accumulate as drift, and late
+    frames are skipped instead of replayed (the last frame is always shown).
+    """
+    loop = asyncio.get_running_loop()
+    frames = tuple(frames)
+    done = loop.create_future()
+    start = loop.time()
+    handle = None
+
+    def step(index: int) -> None:
+        nonlocal handle
+        content.set_progress(frames[index])
+        last = len(frames) - 1
+        if index < last:
+            # Catch up to wall-clock time if the loop was busy, but never
+            # skip the last frame: callers may finalize it as a result line.
+            next_index = min(max(index + 1, int((loop.time() - start) / interval)), last)
+            handle = loop.call_at(start + next_index * interval, step, next_index)
+        else:
+            handle = loop.call_at(start + len(frames) * interval, done.set_result, None)
+
+    if not frames:
+        return
+    step(0)
+    try:
+        await done
+    finally:
+        handle.cancel()
 
 
 async def main():
@@ -112,11 +164,15 @@ async def main():
             content.add_line("Phase 2: Processing data")
             total_chunks = 20
 
-            for i in range(1, total_chunks + 1):
-                # Update progress in place (same line)
-                progress_bar = "█" * (i * 20 // total_chunks) + "░" * (20 - i * 20 // total_chunks)
-                content.set_progress(f"  [{progress_bar}] Chunk {i:2d}/{total_chunks}")
-                await asyncio.sleep(0.1)
+            # Update progress in place (same line)
+            await animate_progress(
+                content,
+                (
+                    f"  [{progress_bar(i, total_chunks)}] Chunk {i:2d}/{total_chunks}"
+                    for i in range(1, total_chunks + 1)
+                ),
+                0.1,
+            )
 
             # Finalize the progress line
             content.finalize_progress()
@@ -125,12 +181,8 @@ async def main():
 
             # Phase 3: Verification with spinner-like progress
             content.add_line("Phase 3: Verifying results")
-            spinner_frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-
-            for i in range(30):  # Spin for 30 frames
-                frame = spinner_frames[i % len(spinner_frames)]
-                content.set_progress(f"  {frame} Validating integrity...")
-                await asyncio.sleep(0.05)
+            # Spin for 30 frames
+            await animate_progress(content, SPINNER_LINES * 3, 0.05)
 
             content.clear_progress()
             content.add_line("  ✓ Verification complete")
@@ -138,9 +190,9 @@ async def main():
 
             # Phase 4: Cleanup with countdown
             content.add_line("Phase 4: Finalizing")
-            for i in range(5, 0, -1):
-                content.set_progress(f"  Completing in {i}...")
-                await asyncio.sleep(0.2)
+            await animate_progress(
+                content, (f"  Completing in {i}..." for i in range(5, 0, -1)), 0.2
+            )
 
             content.clear_progress()
             content.add_line("  ✓ Done!")
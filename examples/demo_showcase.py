@@ -16,9 +16,15 @@ Run:
     python examples/demo_showcase.py
 """
 import asyncio
+import re
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import groupby
 
+from prompt_toolkit.application import get_app
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.document import Document
+from prompt_toolkit.filters import Condition
 
 from thinking_prompt import ThinkingPromptSession, AppInfo
 from thinking_prompt.settings_dialog import (
@@ -29,15 +35,39 @@ from thinking_prompt.settings_dialog import (
     CheckboxItem,
 )
 
-# Check if rich is available for fancy welcome
-try:
-    from rich.panel import Panel
-    from rich.text import Text
-    from rich.console import Group
-    from rich.align import Align
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+# Every possible progress bar, indexed by filled width
+BAR_WIDTH = 30
+BARS = tuple("█" * filled + "░" * (BAR_WIDTH - filled) for filled in range(BAR_WIDTH + 1))
+
+HELP_TEXT = (
+    "## Available Commands\n\n"
+    "Type `/` to see the completion menu, or use these commands:\n\n"
+    "- **/help** - Show this message\n"
+    "- **/confirm** - Yes/No dialog demo\n"
+    "- **/info** - Message dialog demo\n"
+    "- **/action** - Choice dialog demo\n"
+    "- **/theme** - Dropdown dialog demo\n"
+    "- **/settings** - Settings dialog demo\n"
+    "- **/clear** - Clear the screen\n"
+    "- *anything else* - Process with thinking visualization\n"
+)
+
+# Analysis findings that don't depend on the input, formatted once
+STATIC_FINDING_LINES = tuple(
+    f"  • {finding:<40}\n" for finding in ("Sentiment: Positive", "Complexity: Low")
+)
+
+WORD_PATTERN = re.compile(r"\S+")
+
+
+def shorten(text: str, width: int) -> str:
+    """Return text cut to width characters, with "..." appended if it was cut."""
+    return text if len(text) <= width else text[:width] + "..."
+
+
+def count_words(text: str) -> int:
+    """Count whitespace-separated words without building a list of them."""
+    return sum(1 for _ in WORD_PATTERN.finditer(text))
 
 
 class SlashCommandCompleter(Completer):
@@ -53,55 +83,244 @@ class SlashCommandCompleter(Completer):
         "clear": "Clear the screen",
     }
 
+    # Sorted names (for bisect) with their completion text and meta,
+    # formatted once instead of on every keystroke
+    _KEYS = sorted(COMMANDS)
+    _ENTRIES = [(f"/{cmd}", f" - {desc}") for cmd, desc in sorted(COMMANDS.items())]
+
     def get_completions(self, document: Document, complete_event):
         """Yield completions when text starts with /."""
         text = document.text_before_cursor
 
-        if not text.startswith("/"):
+        if not text or text[0] != "/":
             return
 
         partial = text[1:].lower()
-
-        for cmd, desc in self.COMMANDS.items():
-            if cmd.startswith(partial):
-                yield Completion(
-                    text=f"/{cmd}",
-                    start_position=-len(text),
-                    display=f"/{cmd}",
-                    display_meta=f" - {desc}",
-                )
+        start_position = -len(text)
+
+        # Matches form a contiguous run starting at the first key >= partial
+        keys = self._KEYS
+        i = bisect_left(keys, partial)
+        while i < len(keys) and keys[i].startswith(partial):
+            completion_text, meta = self._ENTRIES[i]
+            yield Completion(
+                text=completion_text,
+                start_position=start_position,
+                display=completion_text,
+                display_meta=meta,
+            )
+            i += 1
 
 
-def create_welcome_message():
-    """Create a fancy welcome message with ASCII art."""
-    ascii_art = r"""  _____ _     _       _    _               ____
+WELCOME_ART = r"""  _____ _     _       _    _               ____
  |_   _| |__ (_)_ __ | | _(_)_ __   __ _  | __ )  _____  __
    | | | '_ \| | '_ \| |/ / | '_ \ / _` | |  _ \ / _ \ \/ /
    | | | | | | | | | |   <| | | | | (_| | | |_) | (_) >  <
    |_| |_| |_|_|_| |_|_|\_\_|_| |_|\__, | |____/ \___/_/\_\
                                    |___/"""
 
-    if RICH_AVAILABLE:
-        title = Text(ascii_art, style="bold cyan")
-        subtitle = Text.from_markup(
-            "\n[dim]A [bold]prompt_toolkit[/bold] extension for AI thinking visualization[/dim]\n"
-            "[green]Features:[/green] Real-time streaming • Animated separator • Rich output\n"
-            "[yellow]Controls:[/yellow] [bold]Ctrl+T[/bold] expand • [bold]Ctrl+C[/bold] cancel • [bold]Ctrl+D[/bold] exit • [bold]/[/bold] for commands"
-        )
-        content = Group(Align.center(title), Align.center(subtitle))
-        return Panel(
-            content,
-            border_style="blue",
-            padding=(0, 2),
-        )
-    else:
+
+@lru_cache(maxsize=1)
+def create_welcome_message():
+    """
+    Create a fancy welcome message with ASCII art.
+
+    Cached because the session calls it again on every /clear, and the
+    result never changes.
+    """
+    # Imported here so rich is only loaded when the welcome is shown
+    try:
+        from rich.panel import Panel
+        from rich.text import Text
+        from rich.console import Group
+        from rich.align import Align
+    except ImportError:
         return (
-            ascii_art +
+            WELCOME_ART +
             "\n  A prompt_toolkit extension for AI thinking visualization\n"
             "  Features: Real-time streaming • Animated separator • Rich output\n"
             "  Controls: Ctrl+T expand • Ctrl+C cancel • Ctrl+D exit • / for commands"
         )
 
+    title = Text(WELCOME_ART, style="bold cyan")
+    subtitle = Text.from_markup(
+        "\n[dim]A [bold]prompt_toolkit[/bold] extension for AI thinking visualization[/dim]\n"
+        "[green]Features:[/green] Real-time streaming • Animated separator • Rich output\n"
+        "[yellow]Controls:[/yellow] [bold]Ctrl+T[/bold] expand • [bold]Ctrl+C[/bold] cancel • [bold]Ctrl+D[/bold] exit • [bold]/[/bold] for commands"
+    )
+    content = Group(Align.center(title), Align.center(subtitle))
+    return Panel(
+        content,
+        border_style="blue",
+        padding=(0, 2),
+    )
+
+
+# Settings items are read-only descriptions (values live in the dialog
+# controls), so one list is shared by every /settings invocation
+SETTINGS_ITEMS = [
+    DropdownItem(
+        key="theme",
+        label="Theme",
+        description="Application color scheme",
+        options=["Light", "Dark", "System", "Solarized", "Nord"],
+        default="System",
+    ),
+    InlineSelectItem(
+        key="font_size",
+        label="Font Size",
+        options=["Small", "Medium", "Large", "Extra Large"],
+        default="Medium",
+    ),
+    TextItem(
+        key="username",
+        label="Username",
+        description="Your display name",
+        default="Guest",
+        edit_width=20,
+    ),
+    TextItem(
+        key="api_key",
+        label="API Key",
+        description="Your secret API key",
+        default="",
+        password=True,
+        edit_width=20,
+    ),
+    CheckboxItem(
+        key="notifications",
+        label="Enable Notifications",
+        description="Show desktop notifications",
+        default=True,
+    ),
+    CheckboxItem(
+        key="auto_save",
+        label="Auto Save",
+        default=False,
+    ),
+]
+
+
+class Timeline:
+    """
+    Callbacks laid out in sequence, with waits between them.
+
+    Steps are written like sequential code: call() schedules a callback at
+    the current point and wait() moves that point forward, so changing one
+    step's duration shifts everything after it. run() sleeps once per
+    distinct point, measured against the loop clock so sleep overhead
+    doesn't accumulate. Callbacks that haven't run yet are simply dropped
+    if the run is cancelled.
+    """
+
+    def __init__(self):
+        self._events = []
+        self._offset = 0.0
+
+    def call(self, callback, *args) -> None:
+        """Schedule callback(*args) at the current point."""
+        self._events.append((self._offset, callback, args))
+
+    def wait(self, seconds: float) -> None:
+        """Move the current point ``seconds`` later."""
+        self._offset += seconds
+
+    async def run(self) -> None:
+        """Run all scheduled callbacks in order, then wait out the last wait()."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for offset, group in groupby(self._events, key=lambda event: event[0]):
+            delay = start + offset - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            for _, callback, args in group:
+                callback(*args)
+        delay = start + self._offset - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# =============================================================================
+# Commands
+# =============================================================================
+
+async def cmd_help(session: ThinkingPromptSession) -> None:
+    session.add_response(HELP_TEXT, markdown=True)
+
+
+async def cmd_clear(session: ThinkingPromptSession) -> None:
+    session.clear()
+
+
+async def cmd_confirm(session: ThinkingPromptSession) -> None:
+    result = await session.yes_no_dialog(
+        title="Confirmation",
+        text="Do you want to enable advanced mode?",
+    )
+    session.add_response(f"Advanced mode: **{'enabled' if result else 'disabled'}**", markdown=True)
+
+
+async def cmd_info(session: ThinkingPromptSession) -> None:
+    await session.message_dialog(
+        title="Information",
+        text="ThinkingBox is ready for action!\nAll systems operational.",
+    )
+    session.add_response("Message acknowledged ✓")
+
+
+async def cmd_action(session: ThinkingPromptSession) -> None:
+    result = await session.choice_dialog(
+        title="Select Action",
+        text="What would you like to do?",
+        choices=["Save", "Discard", "Cancel"],
+    )
+    if result:
+        session.add_response(f"Action selected: **{result}**", markdown=True)
+    else:
+        session.add_response("Action cancelled")
+
+
+async def cmd_theme(session: ThinkingPromptSession) -> None:
+    result = await session.dropdown_dialog(
+        title="Select Theme",
+        text="Choose your preferred theme:",
+        options=["Light", "Dark", "System", "High Contrast"],
+        default="System",
+    )
+    if result:
+        session.add_response(f"Theme set to: **{result}**", markdown=True)
+    else:
+        session.add_response("Theme selection cancelled")
+
+
+async def cmd_settings(session: ThinkingPromptSession) -> None:
+    dialog = SettingsDialog(
+        title="Settings",
+        items=SETTINGS_ITEMS,
+    )
+    result = await session.show_dialog(dialog)
+    if result:
+        changes = [f"- **{k}**: {v}" for k, v in result.items()]
+        session.add_response(
+            "## Settings Updated\n\n" + "\n".join(changes),
+            markdown=True
+        )
+    else:
+        session.add_response("Settings cancelled")
+
+
+# Command name -> handler, looked up in one step instead of an if-chain
+COMMAND_HANDLERS = {
+    "help": cmd_help,
+    "clear": cmd_clear,
+    # Dialog demonstrations
+    "confirm": cmd_confirm,
+    "info": cmd_info,
+    "action": cmd_action,
+    "theme": cmd_theme,
+    "settings": cmd_settings,
+}
+
 
 async def main():
     app_info = AppInfo(
@@ -118,17 +337,19 @@ async def main():
         message=">>> ",
         max_thinking_height=12,
         completer=SlashCommandCompleter(),
-        complete_while_typing=True,
+        # Only run the completer while typing a slash command
+        complete_while_typing=Condition(
+            lambda: get_app().current_buffer.text.startswith("/")
+        ),
         completions_menu_height=5,
     )
 
     @session.on_input
     async def handle(user_input: str):
         """Process user input with a rich demonstration."""
-        if not user_input.strip():
-            return
-
         text = user_input.strip()
+        if not text:
+            return
 
         # Handle slash commands
         if text.startswith("/"):
@@ -136,189 +357,65 @@ async def main():
         else:
             cmd = text.lower()
 
-        # Special commands
-        if cmd == "help":
-            session.add_response(
-                "## Available Commands\n\n"
-                "Type `/` to see the completion menu, or use these commands:\n\n"
-                "- **/help** - Show this message\n"
-                "- **/confirm** - Yes/No dialog demo\n"
-                "- **/info** - Message dialog demo\n"
-                "- **/action** - Choice dialog demo\n"
-                "- **/theme** - Dropdown dialog demo\n"
-                "- **/settings** - Settings dialog demo\n"
-                "- **/clear** - Clear the screen\n"
-                "- *anything else* - Process with thinking visualization\n",
-                markdown=True
-            )
-            return
-
-        if cmd == "clear":
-            session.clear()
-            return
-
-        # Dialog demonstrations
-        if cmd == "confirm":
-            result = await session.yes_no_dialog(
-                title="Confirmation",
-                text="Do you want to enable advanced mode?",
-            )
-            session.add_response(f"Advanced mode: **{'enabled' if result else 'disabled'}**", markdown=True)
-            return
-
-        if cmd == "info":
-            await session.message_dialog(
-                title="Information",
-                text="ThinkingBox is ready for action!\nAll systems operational.",
-            )
-            session.add_response("Message acknowledged ✓")
-            return
-
-        if cmd == "action":
-            result = await session.choice_dialog(
-                title="Select Action",
-                text="What would you like to do?",
-                choices=["Save", "Discard", "Cancel"],
-            )
-            if result:
-                session.add_response(f"Action selected: **{result}**", markdown=True)
-            else:
-                session.add_response("Action cancelled")
-            return
-
-        if cmd == "theme":
-            result = await session.dropdown_dialog(
-                title="Select Theme",
-                text="Choose your preferred theme:",
-                options=["Light", "Dark", "System", "High Contrast"],
-                default="System",
-            )
-            if result:
-                session.add_response(f"Theme set to: **{result}**", markdown=True)
-            else:
-                session.add_response("Theme selection cancelled")
-            return
-
-        if cmd == "settings":
-            settings_items = [
-                DropdownItem(
-                    key="theme",
-                    label="Theme",
-                    description="Application color scheme",
-                    options=["Light", "Dark", "System", "Solarized", "Nord"],
-                    default="System",
-                ),
-                InlineSelectItem(
-                    key="font_size",
-                    label="Font Size",
-                    options=["Small", "Medium", "Large", "Extra Large"],
-                    default="Medium",
-                ),
-                TextItem(
-                    key="username",
-                    label="Username",
-                    description="Your display name",
-                    default="Guest",
-                    edit_width=20,
-                ),
-                TextItem(
-                    key="api_key",
-                    label="API Key",
-                    description="Your secret API key",
-                    default="",
-                    password=True,
-                    edit_width=20,
-                ),
-                CheckboxItem(
-                    key="notifications",
-                    label="Enable Notifications",
-                    description="Show desktop notifications",
-                    default=True,
-                ),
-                CheckboxItem(
-                    key="auto_save",
-                    label="Auto Save",
-                    default=False,
-                ),
-            ]
-            dialog = SettingsDialog(
-                title="Settings",
-                items=settings_items,
-            )
-            result = await session.show_dialog(dialog)
-            if result:
-                changes = [f"- **{k}**: {v}" for k, v in result.items()]
-                session.add_response(
-                    "## Settings Updated\n\n" + "\n".join(changes),
-                    markdown=True
-                )
-            else:
-                session.add_response("Settings cancelled")
+        command = COMMAND_HANDLERS.get(cmd)
+        if command is not None:
+            await command(session)
             return
 
         # Use context manager for thinking
         async with session.thinking() as content:
-            # Phase 1: Initialization with spinner effect
-            content.append("Initialization\n")
+            timeline = Timeline()
 
+            # Phase 1: Initialization with spinner effect
+            timeline.call(content.append, "Initialization\n")
             steps = ["Loading modules", "Parsing input", "Allocating memory"]
-            for i, step in enumerate(steps):
-                content.append(f"  ✓ {step}\n")
-                await asyncio.sleep(0.5)
+            for step in steps:
+                timeline.call(content.append, f"  ✓ {step}\n")
+                timeline.wait(0.5)
 
             # Console message
-            session.add_message("system", "Initialization complete")
-            await asyncio.sleep(0.5)
+            timeline.call(session.add_message, "system", "Initialization complete")
+            timeline.wait(0.5)
 
-            # Phase 2: Processing with progress bar
+            # Phase 2: Processing with progress bar, updated in place
             total = 15
-            for i in range(total + 1):
-                bar_width = 30
-                filled = int(bar_width * i / total)
-                bar = "█" * filled + "░" * (bar_width - filled)
-                percent = i * 100 // total
-
-                # Update progress line in place
-                if i > 0:
-                    # Remove previous progress line
-                    lines = content.text.split('\n')
-                    lines = lines[:-2]  # Remove last line (progress) and empty
-                    content.clear()
-                    content.append('\n'.join(lines) + '\n')
-
-                content.append(f"  [{bar}] {percent:3d}%\n")
-                await asyncio.sleep(0.1)
+            timeline.call(content.append, f"  [{BARS[0]}]   0%\n")
+            for i in range(1, total + 1):
+                timeline.wait(0.1)
+                bar = BARS[BAR_WIDTH * i // total]
+                timeline.call(content.replace_last, f"  [{bar}] {i * 100 // total:3d}%\n")
+            timeline.wait(0.1)
 
             # Console success message
-            session.add_success("Processing complete")
-            await asyncio.sleep(0.5)
+            timeline.call(session.add_success, "Processing complete")
+            timeline.wait(0.5)
 
-            # Phase 3: Analysis
-            content.append("Analysis\n")
-            findings = [
+            # Phase 3: Analysis, findings revealed two at a time
+            finding_delay = 0.4
+            input_findings = (
                 f"Input length: {len(user_input)} characters",
-                f"Word count: {len(user_input.split())} words",
-                "Sentiment: Positive",
-                "Complexity: Low",
-            ]
-
-            for finding in findings:
-                content.append(f"  • {finding:<40}\n")
-                await asyncio.sleep(0.4)
+                f"Word count: {count_words(user_input)} words",
+            )
+            timeline.call(content.append, "Analysis\n")
+            timeline.call(content.extend, [f"  • {finding:<40}\n" for finding in input_findings])
+            timeline.wait(2 * finding_delay)
+            timeline.call(content.extend, STATIC_FINDING_LINES)
+            timeline.wait(2 * finding_delay)
+            timeline.wait(0.3)
 
-            await asyncio.sleep(0.3)
+            await timeline.run()
 
         # Final output with markdown
         session.add_response(
             f"**Analysis Complete**\n\n"
-            f"> {user_input[:50]}{'...' if len(user_input) > 50 else ''}\n\n"
+            f"> {shorten(user_input, 50)}\n\n"
             f"**Summary:** Your input has been processed successfully.\n",
             markdown=True
         )
 
         # Show some code
         session.add_code(
-            f'result = analyze("{user_input[:20]}...")\n'
+            f'result = analyze("{shorten(user_input, 20)}")\n'
             f'print(f"Processed {{len(result)}} items")',
             language="python"
         )
@@ -328,4 +425,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use uvloop's faster event loop when installed (POSIX only)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -65,6 +65,105 @@ class LoginDialog(BaseDialog):
         self.set_result({"username": username})
 
 
+# A DialogConfig is only read when shown, so it can be built once and reused
+CUSTOM_DIALOG = DialogConfig(
+    title="Custom Dialog",
+    body="This dialog was created using DialogConfig.\nChoose an option:",
+    buttons=[
+        ButtonConfig(text="Option A", result="a"),
+        ButtonConfig(text="Option B", result="b"),
+        ButtonConfig(text="Option C", result="c"),
+    ],
+    escape_result=None,  # Escape returns None
+)
+
+
+# =============================================================================
+# Commands
+# =============================================================================
+
+async def cmd_quit(session: ThinkingPromptSession) -> None:
+    session.exit()
+
+
+async def cmd_settings(session: ThinkingPromptSession) -> None:
+    # Yes/No dialog
+    result = await session.yes_no_dialog(
+        title="Settings",
+        text="Enable advanced mode?",
+    )
+    session.add_response(f"Advanced mode: {'enabled' if result else 'disabled'}")
+
+
+async def cmd_info(session: ThinkingPromptSession) -> None:
+    # Message dialog (just OK button)
+    await session.message_dialog(
+        title="Information",
+        text="This is an informational message.\nPress OK to continue.",
+    )
+    session.add_response("Message acknowledged")
+
+
+async def cmd_action(session: ThinkingPromptSession) -> None:
+    # Choice dialog (multiple buttons)
+    result = await session.choice_dialog(
+        title="Select Action",
+        text="What would you like to do?",
+        choices=["Save", "Discard", "Cancel"],
+    )
+    if result:
+        session.add_response(f"Selected action: {result}")
+    else:
+        session.add_response("Action cancelled (Escape pressed)")
+
+
+async def cmd_theme(session: ThinkingPromptSession) -> None:
+    # Dropdown dialog (radio list selection)
+    result = await session.dropdown_dialog(
+        title="Select Theme",
+        text="Choose a color theme:",
+        options=["Light", "Dark", "System", "High Contrast"],
+        default="System",
+    )
+    if result:
+        session.add_response(f"Theme set to: {result}")
+    else:
+        session.add_response("Theme selection cancelled")
+
+
+async def cmd_custom(session: ThinkingPromptSession) -> None:
+    # Custom dialog via DialogConfig (composition pattern)
+    result = await session.show_dialog(CUSTOM_DIALOG)
+    if result:
+        session.add_response(f"You chose: Option {result.upper()}")
+    else:
+        session.add_response("Custom dialog cancelled")
+
+
+async def cmd_login(session: ThinkingPromptSession) -> None:
+    # Custom dialog via BaseDialog subclass
+    dialog = LoginDialog()
+    result = await session.show_dialog(dialog)
+    if result:
+        session.add_response(f"Login attempt: user='{result['username']}'")
+    else:
+        session.add_response("Login cancelled")
+
+
+# Command name -> handler, looked up in one step instead of an if-chain
+COMMAND_HANDLERS = {
+    "quit": cmd_quit,
+    # Built-in dialogs
+    "settings": cmd_settings,
+    "info": cmd_info,
+    "action": cmd_action,
+    "theme": cmd_theme,
+    # Custom dialogs
+    "custom": cmd_custom,
+    "login": cmd_login,
+}
+
+
 async def main():
     app_info = AppInfo(
         name="Dialog Demo",
@@ -93,90 +192,9 @@ async def main():
         if not text:
             return
 
-        if text == "quit":
-            session.exit()
-            return
-
-        # =====================================================================
-        # Built-in Dialogs
-        # =====================================================================
-
-        if text == "settings":
-            # Yes/No dialog
-            result = await session.yes_no_dialog(
-                title="Settings",
-                text="Enable advanced mode?",
-            )
-            session.add_response(f"Advanced mode: {'enabled' if result else 'disabled'}")
-            return
-
-        if text == "info":
-            # Message dialog (just OK button)
-            await session.message_dialog(
-                title="Information",
-                text="This is an informational message.\nPress OK to continue.",
-            )
-            session.add_response("Message acknowledged")
-            return
-
-        if text == "action":
-            # Choice dialog (multiple buttons)
-            result = await session.choice_dialog(
-                title="Select Action",
-                text="What would you like to do?",
-                choices=["Save", "Discard", "Cancel"],
-            )
-            if result:
-                session.add_response(f"Selected action: {result}")
-            else:
-                session.add_response("Action cancelled (Escape pressed)")
-            return
-
-        if text == "theme":
-            # Dropdown dialog (radio list selection)
-            result = await session.dropdown_dialog(
-                title="Select Theme",
-                text="Choose a color theme:",
-                options=["Light", "Dark", "System", "High Contrast"],
-                default="System",
-            )
-            if result:
-                session.add_response(f"Theme set to: {result}")
-            else:
-                session.add_response("Theme selection cancelled")
-            return
-
-        # =====================================================================
-        # Custom Dialogs
-        # =====================================================================
-
-        if text == "custom":
-            # Custom dialog via DialogConfig (composition pattern)
-            config = DialogConfig(
-                title="Custom Dialog",
-                body="This dialog was created using DialogConfig.\nChoose an option:",
-                buttons=[
-                    ButtonConfig(text="Option A", result="a"),
-                    ButtonConfig(text="Option B", result="b"),
-                    ButtonConfig(text="Option C", result="c"),
-                ],
-                escape_result=None,  # Escape returns None
-            )
-            result = await session.show_dialog(config)
-            if result:
-                session.add_response(f"You chose: Option {result.upper()}")
-            else:
-                session.add_response("Custom dialog cancelled")
-            return
-
-        if text == "login":
-            # Custom dialog via BaseDialog subclass
-            dialog = LoginDialog()
-            result = await session.show_dialog(dialog)
-            if result:
-                session.add_response(f"Login attempt: user='{result['username']}'")
-            else:
-                session.add_response("Login cancelled")
+        command = COMMAND_HANDLERS.get(text)
+        if command is not None:
+            await command(session)
             return
 
         # Default: echo
@@ -186,4 +204,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use uvloop's faster event loop when installed (POSIX only)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -13,9 +13,53 @@ Run:
     python examples/progress_demo.py
 """
 import asyncio
+from typing import Optional
 
 from thinking_prompt import ThinkingPromptSession, AppInfo
 
+# Every possible progress bar, indexed by filled width; the UI calls
+# get_content() on every refresh, so bars are looked up rather than built
+BAR_WIDTH = 30
+BARS = tuple("█" * filled + "░" * (BAR_WIDTH - filled) for filled in range(BAR_WIDTH + 1))
+
+
+def shorten(text: str, width: int) -> str:
+    """Return text cut to width characters, with "..." appended if it was cut."""
+    return text if len(text) <= width else text[:width] + "..."
+
+
+class ProgressView:
+    """
+    Progress state shown in the thinking box.
+
+    The UI calls get_content() on every refresh, so the rendered text is
+    kept until update() changes the state.
+    """
+
+    def __init__(self, preview: str):
+        self._preview = preview
+        self._percent = 0
+        self._status = "Starting..."
+        self._rendered: Optional[str] = None
+
+    def update(self, percent: int, status: str) -> None:
+        """Set new progress and drop the rendered text."""
+        self._percent = percent
+        self._status = status
+        self._rendered = None
+
+    def get_content(self) -> str:
+        """Return current content - called repeatedly by the UI."""
+        if self._rendered is None:
+            bar = BARS[BAR_WIDTH * self._percent // 100]
+            self._rendered = (
+                f"Processing: {self._preview}\n"
+                f"Progress: [{bar}] {self._percent}%\n"
+                f"\n"
+                f"Status: {self._status}\n"
+            )
+        return self._rendered
+
 
 async def main():
     app_info = AppInfo(name="ProgressDemo", version="1.0.0")
@@ -28,27 +72,13 @@ async def main():
     @session.on_input
     async def handle(text: str):
         """Simulate a task with progress updates."""
-        if not text.strip():
+        if not text or text.isspace():
             return
 
-        # Mutable state that the callback reads
-        progress = {"percent": 0, "status": "Starting..."}
-
-        def get_content():
-            """Return current content - called repeatedly by the UI."""
-            bar_width = 30
-            filled = int(bar_width * progress["percent"] / 100)
-            bar = "█" * filled + "░" * (bar_width - filled)
-
-            return (
-                f"Processing: {text[:40]}{'...' if len(text) > 40 else ''}\n"
-                f"Progress: [{bar}] {progress['percent']}%\n"
-                f"\n"
-                f"Status: {progress['status']}\n"
-            )
+        progress = ProgressView(shorten(text, 40))
 
         # Start thinking mode
-        session.start_thinking(get_content)
+        session.start_thinking(progress.get_content)
 
         # Simulate work with progress updates
         steps = [
@@ -63,8 +93,7 @@ async def main():
         ]
 
         for percent, status in steps:
-            progress["percent"] = percent
-            progress["status"] = status
+            progress.update(percent, status)
             await asyncio.sleep(0.4)
 
         await asyncio.sleep(0.3)
@@ -80,6 +109,12 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        # Use uvloop's faster event loop when installed (POSIX only)
+        try:
+            import uvloop
+        except ImportError:
+            asyncio.run(main())
+        else:
+            uvloop.run(main())
     except KeyboardInterrupt:
         pass
@@ -9,8 +9,10 @@ Run:
 """
 import asyncio
 import random
+from bisect import bisect_right
+from itertools import accumulate
 
-from thinking_prompt import ThinkingPromptSession, AppInfo
+from thinking_prompt import ThinkingPromptSession, AppInfo, StreamingContent
 
 
 # Sample responses for simulation
@@ -21,6 +23,27 @@ SAMPLE_RESPONSES = [
 ]
 
 
+def char_schedule(text: str) -> list:
+    """
+    Return when each character of text should appear, in seconds from the
+    start of the stream. Spaces and newlines get a longer delay for a more
+    realistic effect.
+    """
+    return list(accumulate(0.02 if char in " \n" else 0.01 for char in text))
+
+
+# (response, schedule) pairs, computed once since the responses are fixed
+SAMPLE_SCHEDULES = [(response, char_schedule(response)) for response in SAMPLE_RESPONSES]
+
+# Private generator for picking responses; can be reseeded for repeatable runs
+_rng = random.Random()
+
+
+# How often to emit a batch of characters; each character still has its own
+# delay, but all characters due since the last tick are appended at once
+TICK_INTERVAL = 0.05
+
+
 async def main():
     """Main async function."""
     app_info = AppInfo(name="StreamingDemo", version="1.0.0")
@@ -37,30 +60,34 @@ async def main():
             return
 
         # Pick a random response
-        response = random.choice(SAMPLE_RESPONSES)
-
-        # Use a list for O(1) append
-        chunks = []
+        response, due = _rng.choice(SAMPLE_SCHEDULES)
 
-        def get_content():
-            return ''.join(chunks)
+        # StreamingContent keeps the joined text between appends for repaints
+        content = StreamingContent()
 
         # Start thinking mode
-        session.start_thinking(get_content)
+        session.start_thinking(content.get_content)
 
         # Start with a header
-        chunks.append(f"Thinking about: {question[:50]}...\n\n")
+        content.append(f"Thinking about: {question[:50]}...\n\n")
         await asyncio.sleep(0.2)
 
-        # Stream character by character (like an LLM)
-        for char in response:
-            chunks.append(char)
-            # Variable delay for more realistic effect
-            delay = 0.02 if char in " \n" else 0.01
-            await asyncio.sleep(delay)
+        # Stream character by character (like an LLM); due[i] is when
+        # character i should appear, relative to the start of the stream
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        sent = 0
+        while sent < len(response):
+            await asyncio.sleep(TICK_INTERVAL)
+            # Emit everything due by now, measured against the loop clock so
+            # timer jitter doesn't stretch the total duration
+            ready = bisect_right(due, loop.time() - start)
+            if ready > sent:
+                content.append(response[sent:ready])
+                sent = ready
 
         # Add a newline at the end
-        chunks.append("\n")
+        content.append("\n")
         await asyncio.sleep(0.3)
 
         # Finish and persist to console
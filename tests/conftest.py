@@ -3,14 +3,30 @@ Shared fixtures for thinking_prompt tests.
 """
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 import pytest
 from typing import Callable, List
+from prompt_toolkit.formatted_text import fragment_list_to_text
 
 from thinking_prompt import ThinkingPromptStyles
 from thinking_prompt.thinking import ThinkingBoxControl
 from thinking_prompt.history import FormattedTextHistory
 
 
+def _render_text(source, width: int = 50) -> str:
+    """Plain text of a formatted text list, or of a UI control's first line."""
+    if hasattr(source, "create_content"):
+        source = source.create_content(width=width, height=1).get_line(0)
+    return fragment_list_to_text(source)
+
+
+@pytest.fixture(scope="session")
+def render_text() -> Callable[..., str]:
+    """Helper that strips styles from formatted text or a rendered control."""
+    return _render_text
+
+
 @pytest.fixture
 def thinking_control() -> ThinkingBoxControl:
     """Create a fresh ThinkingBoxControl instance."""
@@ -23,6 +39,14 @@ def small_thinking_control() -> ThinkingBoxControl:
     return ThinkingBoxControl(max_collapsed_lines=5)
 
 
+@pytest.fixture
+def started_control(request, thinking_control: ThinkingBoxControl) -> ThinkingBoxControl:
+    """A thinking_control already started; content comes from indirect params."""
+    content = getattr(request, "param", "test")
+    thinking_control.start(lambda: content)
+    return thinking_control
+
+
 @pytest.fixture
 def history() -> FormattedTextHistory:
     """Create a fresh FormattedTextHistory instance."""
@@ -35,6 +59,13 @@ def default_styles() -> ThinkingPromptStyles:
     return ThinkingPromptStyles()
 
 
+@pytest.fixture
+def dialog_session_stub() -> SimpleNamespace:
+    """Minimal stand-in for a session, with just the app attributes DialogManager reads."""
+    app = SimpleNamespace(layout=SimpleNamespace(), key_bindings=None)
+    return SimpleNamespace(app=app)
+
+
 @pytest.fixture
 def content_builder() -> Callable[[], tuple[List[str], Callable[[], str]]]:
     """
@@ -54,13 +85,13 @@ def content_builder() -> Callable[[], tuple[List[str], Callable[[], str]]]:
     return factory
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multiline_content() -> str:
     """Generate multiline content for testing."""
     return "\n".join([f"Line {i}" for i in range(20)])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def short_content() -> str:
     """Generate short content that fits in collapsed view."""
     return "\n".join([f"Line {i}" for i in range(3)])
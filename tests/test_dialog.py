@@ -6,9 +6,8 @@ async fixtures and simulate button clicks via the result future.
 """
 from __future__ import annotations
 
-import asyncio
+from concurrent.futures import Future
 from typing import Any, Callable, List
-from unittest.mock import MagicMock, patch
 
 import pytest
 from prompt_toolkit.layout import HSplit, Window
@@ -20,6 +19,7 @@ from thinking_prompt.dialog import (
     DialogConfig,
     DialogManager,
     _UNSET,
+    _Unset,
     _ConfigBasedDialog,
     _YesNoDialog,
     _MessageDialog,
@@ -32,6 +32,48 @@ from thinking_prompt.dialog import (
 )
 
 
+# =============================================================================
+# Test Dialogs
+# =============================================================================
+
+class _BodyDialog(BaseDialog):
+    """Dialog with a label body and the default OK button."""
+
+    title = "Test"
+    escape_result = "escaped"
+
+    def build_body(self):
+        return Label("Body")
+
+
+class _ResultDialog(BaseDialog):
+    """Dialog whose OK button returns a dict."""
+
+    title = "Test"
+
+    def build_body(self):
+        return Label("Test")
+
+    def get_buttons(self):
+        return [("OK", lambda: self.set_result({"key": "value"}))]
+
+
+class _MultiButtonDialog(BaseDialog):
+    """Dialog with three buttons returning "a", "b" and "c"."""
+
+    title = "Test"
+
+    def build_body(self):
+        return Label("Choose")
+
+    def get_buttons(self):
+        return [
+            ("A", lambda: self.set_result("a")),
+            ("B", lambda: self.set_result("b")),
+            ("C", lambda: self.set_result("c")),
+        ]
+
+
 # =============================================================================
 # ButtonConfig Tests
 # =============================================================================
@@ -148,64 +190,32 @@ class TestBaseDialog:
 
     def test_base_dialog_build_widget(self):
         """BaseDialog._build_widget creates Dialog widget."""
-        class TestDialog(BaseDialog):
-            title = "Test"
-
-            def build_body(self):
-                return Label("Body")
-
-            def get_buttons(self):
-                return [("OK", lambda: None)]
-
-        dialog = TestDialog()
+        dialog = _BodyDialog()
         widget = dialog._build_widget()
         assert dialog._widget is widget
         assert widget is not None
 
     def test_base_dialog_set_result(self):
         """BaseDialog.set_result sets the future."""
-        class TestDialog(BaseDialog):
-            title = "Test"
-
-            def build_body(self):
-                return Label("Body")
-
-        dialog = TestDialog()
+        dialog = _BodyDialog()
 
         # Simulate prepare (creates future)
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            future = loop.create_future()
-            dialog._result_future = future
-
-            dialog.set_result("test_value")
-            assert future.done()
-            assert future.result() == "test_value"
-        finally:
-            loop.close()
+        future = Future()
+        dialog._result_future = future
+
+        dialog.set_result("test_value")
+        assert future.done()
+        assert future.result() == "test_value"
 
     def test_base_dialog_cancel(self):
         """BaseDialog.cancel sets escape_result."""
-        class TestDialog(BaseDialog):
-            title = "Test"
-            escape_result = "escaped"
-
-            def build_body(self):
-                return Label("Body")
-
-        dialog = TestDialog()
+        dialog = _BodyDialog()
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            future = loop.create_future()
-            dialog._result_future = future
+        future = Future()
+        dialog._result_future = future
 
-            dialog.cancel()
-            assert future.result() == "escaped"
-        finally:
-            loop.close()
+        dialog.cancel()
+        assert future.result() == "escaped"
 
 
 # =============================================================================
@@ -368,26 +378,16 @@ class TestConfigBasedDialog:
 class TestDialogManager:
     """Tests for DialogManager (unit tests without full Application)."""
 
-    def test_dialog_manager_initial_state(self):
+    def test_dialog_manager_initial_state(self, dialog_session_stub):
         """DialogManager starts with correct initial state."""
-        mock_session = MagicMock()
-        mock_session.app = MagicMock()
-        mock_session.app.layout = MagicMock()
-        mock_session.app.key_bindings = None
-
-        manager = DialogManager(mock_session)
+        manager = DialogManager(dialog_session_stub)
         assert manager._visible is False
         assert manager._current_dialog is None
         assert manager._injected is False
 
-    def test_dialog_manager_key_bindings_created(self):
+    def test_dialog_manager_key_bindings_created(self, dialog_session_stub):
         """DialogManager creates key bindings for Escape."""
-        mock_session = MagicMock()
-        mock_session.app = MagicMock()
-        mock_session.app.layout = MagicMock()
-        mock_session.app.key_bindings = None
-
-        manager = DialogManager(mock_session)
+        manager = DialogManager(dialog_session_stub)
         assert manager._key_bindings is not None
 
 
@@ -400,64 +400,30 @@ class TestDialogIntegration:
 
     def test_dialog_result_flow(self):
         """Dialog result is properly passed through future."""
-        class ResultDialog(BaseDialog):
-            title = "Test"
-
-            def build_body(self):
-                return Label("Test")
-
-            def get_buttons(self):
-                return [("OK", lambda: self.set_result({"key": "value"}))]
-
-        dialog = ResultDialog()
+        dialog = _ResultDialog()
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            # Simulate prepare
-            future = loop.create_future()
-            dialog._result_future = future
+        # Simulate prepare
+        future = Future()
+        dialog._result_future = future
 
-            # Simulate button click
-            buttons = dialog.get_buttons()
-            buttons[0][1]()  # Click OK
+        # Simulate button click
+        buttons = dialog.get_buttons()
+        buttons[0][1]()  # Click OK
 
-            assert future.done()
-            assert future.result() == {"key": "value"}
-        finally:
-            loop.close()
+        assert future.done()
+        assert future.result() == {"key": "value"}
 
-    def test_multiple_buttons_return_correct_results(self):
+    @pytest.mark.parametrize("expected,idx", [("a", 0), ("b", 1), ("c", 2)])
+    def test_multiple_buttons_return_correct_results(self, expected, idx):
         """Each button returns its configured result."""
-        results = []
-
-        class MultiButtonDialog(BaseDialog):
-            title = "Test"
+        dialog = _MultiButtonDialog()
+        future = Future()
+        dialog._result_future = future
 
-            def build_body(self):
-                return Label("Choose")
-
-            def get_buttons(self):
-                return [
-                    ("A", lambda: self.set_result("a")),
-                    ("B", lambda: self.set_result("b")),
-                    ("C", lambda: self.set_result("c")),
-                ]
-
-        for expected, idx in [("a", 0), ("b", 1), ("c", 2)]:
-            dialog = MultiButtonDialog()
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                future = loop.create_future()
-                dialog._result_future = future
-
-                buttons = dialog.get_buttons()
-                buttons[idx][1]()  # Click button
+        buttons = dialog.get_buttons()
+        buttons[idx][1]()  # Click button
 
-                assert future.result() == expected
-            finally:
-                loop.close()
+        assert future.result() == expected
 
 
 # =============================================================================
@@ -469,15 +435,8 @@ class TestDialogEdgeCases:
 
     def test_dialog_with_no_buttons(self):
         """Dialog can have no custom buttons (uses default OK)."""
-        class NoButtonDialog(BaseDialog):
-            title = "Info"
-
-            def build_body(self):
-                return Label("Just info")
-
-            # Uses default get_buttons() which returns [("OK", ...)]
-
-        dialog = NoButtonDialog()
+        # _BodyDialog uses default get_buttons() which returns [("OK", ...)]
+        dialog = _BodyDialog()
         buttons = dialog.get_buttons()
         assert len(buttons) == 1
         assert buttons[0][0] == "OK"
@@ -495,32 +454,21 @@ class TestDialogEdgeCases:
                 return [("Acknowledge", lambda: self.set_result(True))]
 
         dialog = NoEscapeDialog()
-        from thinking_prompt.dialog import _Unset
         assert isinstance(dialog.escape_result, _Unset)
 
     def test_set_result_only_works_once(self):
         """Setting result multiple times doesn't change first result."""
-        class TestDialog(BaseDialog):
-            title = "Test"
-
-            def build_body(self):
-                return Label("Test")
-
-        dialog = TestDialog()
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            future = loop.create_future()
-            dialog._result_future = future
+        dialog = _BodyDialog()
+        future = Future()
+        dialog._result_future = future
 
-            dialog.set_result("first")
-            dialog.set_result("second")  # Should be ignored
+        dialog.set_result("first")
+        dialog.set_result("second")  # Should be ignored
 
-            assert future.result() == "first"
-        finally:
-            loop.close()
+        assert future.result() == "first"
 
-    def test_config_button_closure_captures_correctly(self):
+    @pytest.mark.parametrize("expected,idx", [(1, 0), (2, 1), (3, 2)])
+    def test_config_button_closure_captures_correctly(self, expected, idx):
         """ButtonConfig results are captured correctly in closures."""
         config = DialogConfig(
             title="Test",
@@ -534,19 +482,9 @@ class TestDialogEdgeCases:
         dialog = _ConfigBasedDialog(config)
         buttons = dialog.get_buttons()
 
-        # Test each button
-        for expected, idx in [(1, 0), (2, 1), (3, 2)]:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                future = loop.create_future()
-                dialog._result_future = future
-
-                buttons[idx][1]()  # Click button
+        future = Future()
+        dialog._result_future = future
 
-                assert future.result() == expected
+        buttons[idx][1]()  # Click button
 
-                # Reset for next iteration
-                dialog._result_future = None
-            finally:
-                loop.close()
+        assert future.result() == expected
@@ -44,6 +44,29 @@ class TestIsRichRenderable:
 
         assert is_rich_renderable(FakeRenderable())
 
+    def test_result_consistent_across_instances(self):
+        """Repeated checks on instances of one type should agree."""
+        class FakeRenderable:
+            def __rich__(self):
+                pass
+
+        class Plain:
+            pass
+
+        for _ in range(2):
+            assert is_rich_renderable(FakeRenderable())
+            assert not is_rich_renderable(Plain())
+
+    def test_instance_level_protocol_is_renderable(self):
+        """Protocol provided per instance via __getattr__ should be detected."""
+        class Proxy:
+            def __getattr__(self, name):
+                if name == '__rich__':
+                    return lambda: "proxied"
+                raise AttributeError(name)
+
+        assert is_rich_renderable(Proxy())
+
 
 class TestRichToAnsi:
     """Test rich_to_ansi function."""
@@ -57,7 +80,7 @@ class TestRichToAnsi:
     def test_handles_none_gracefully(self):
         """Should handle None gracefully."""
         result = rich_to_ansi(None)
-        assert isinstance(result, str)
+        assert result == ""
 
     def test_rich_text_if_available(self):
         """Should convert Rich Text if available."""
@@ -99,9 +122,14 @@ class TestMarkdownToAnsi:
         assert "Item 1" in result
 
     def test_empty_string(self):
-        """Should handle empty string."""
+        """Should render empty markdown as nothing."""
         result = markdown_to_ansi("")
-        assert isinstance(result, str)
+        assert result == ""
+
+    def test_repeated_call_returns_same_result(self):
+        """Rendering the same markdown twice should give identical output."""
+        md = "# Title\n\nSome *text*"
+        assert markdown_to_ansi(md) == markdown_to_ansi(md)
 
 
 class TestHighlightCode:
@@ -140,35 +168,52 @@ class TestHighlightCode:
         assert isinstance(result, str)
         assert "const" in result or "console" in result
 
+    def test_repeated_call_served_from_cache(self):
+        """Highlighting the same code twice should reuse the first result."""
+        highlight_code.cache_clear()
+        first = highlight_code("y = 2", "python")
+        second = highlight_code("y = 2", "python")
+        assert second is first
+        assert highlight_code.cache_info().hits == 1
+
 
 # =============================================================================
 # Display Class Tests
 # =============================================================================
 
-from prompt_toolkit.formatted_text import FormattedText
+from prompt_toolkit.formatted_text import ANSI, FormattedText
 from prompt_toolkit.styles import Style
 
 from thinking_prompt.display import Display
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def default_style() -> Style:
     """Create a minimal style for testing."""
     return Style.from_dict({})
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def display(default_style: Style) -> Display:
     """Create a Display instance in prompt mode (not fullscreen)."""
     return Display(style=default_style, is_fullscreen=lambda: False)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def fullscreen_display(default_style: Style) -> Display:
     """Create a Display instance in fullscreen mode."""
     return Display(style=default_style, is_fullscreen=lambda: True)
 
 
+@pytest.fixture(autouse=True)
+def reset_displays(display: Display, fullscreen_display: Display) -> None:
+    """Start each test with empty history and no pending output or callback."""
+    for shared in (display, fullscreen_display):
+        shared.set_on_change(None)
+        shared.history.clear()
+        shared._pending_output.clear()
+
+
 class TestDisplayInit:
     """Test Display initialization."""
 
@@ -213,8 +258,7 @@ class TestDisplayUserInput:
     def test_adds_to_history(self, display: Display):
         """Should add prompt and text to history."""
         display.user_input(">>> ", "hello")
-        formatted = display.history.get_formatted_text()
-        text = "".join(t for _, t in formatted)
+        text = display.history.plain_text
         assert ">>> " in text
         assert "hello" in text
 
@@ -239,8 +283,7 @@ class TestDisplayThinking:
     def test_adds_to_history(self, display: Display):
         """Should add thinking content to history."""
         display.thinking("Processing...")
-        formatted = display.history.get_formatted_text()
-        text = "".join(t for _, t in formatted)
+        text = display.history.plain_text
         assert "Processing..." in text
 
     def test_skips_empty_content(self, display: Display):
@@ -254,8 +297,7 @@ class TestDisplayThinking:
         content = "\n".join([f"Line {i}" for i in range(10)])
         display.thinking(content, truncate_lines=3)
         # History should have full content
-        formatted = display.history.get_formatted_text()
-        text = "".join(t for _, t in formatted)
+        text = display.history.plain_text
         assert "Line 9" in text  # Full content in history
 
     def test_skip_history_when_requested(self, display: Display):
@@ -275,8 +317,7 @@ class TestDisplayResponse:
     def test_adds_to_history(self, display: Display):
         """Should add response to history."""
         display.response("Hello, world!")
-        formatted = display.history.get_formatted_text()
-        text = "".join(t for _, t in formatted)
+        text = display.history.plain_text
         assert "Hello, world!" in text
 
     def test_uses_correct_style(self, display: Display):
@@ -299,27 +340,27 @@ class TestDisplaySystemMessages:
     def test_system_adds_to_history(self, display: Display):
         """System message should be added to history."""
         display.system("System message")
-        text = "".join(t for _, t in display.history.get_formatted_text())
+        text = display.history.plain_text
         assert "System message" in text
 
     def test_error_has_prefix(self, display: Display):
         """Error should have [ERROR] prefix."""
         display.error("Something failed")
-        text = "".join(t for _, t in display.history.get_formatted_text())
+        text = display.history.plain_text
         assert "[ERROR]" in text
         assert "Something failed" in text
 
     def test_warning_has_prefix(self, display: Display):
         """Warning should have [WARN] prefix."""
         display.warning("Be careful")
-        text = "".join(t for _, t in display.history.get_formatted_text())
+        text = display.history.plain_text
         assert "[WARN]" in text
         assert "Be careful" in text
 
     def test_success_has_prefix(self, display: Display):
         """Success should have [OK] prefix."""
         display.success("Done")
-        text = "".join(t for _, t in display.history.get_formatted_text())
+        text = display.history.plain_text
         assert "[OK]" in text
         assert "Done" in text
 
@@ -345,14 +386,12 @@ class TestDisplayMarkdownAndCode:
 
     def test_markdown_caches_in_fullscreen(self, fullscreen_display: Display):
         """Markdown should cache in fullscreen mode."""
-        from prompt_toolkit.formatted_text import ANSI
         fullscreen_display.markdown("# Title")
         assert len(fullscreen_display._pending_output) == 1
         assert isinstance(fullscreen_display._pending_output[0], ANSI)
 
     def test_code_caches_in_fullscreen(self, fullscreen_display: Display):
         """Code should cache in fullscreen mode."""
-        from prompt_toolkit.formatted_text import ANSI
         fullscreen_display.code("x = 1")
         assert len(fullscreen_display._pending_output) == 1
         assert isinstance(fullscreen_display._pending_output[0], ANSI)
@@ -364,7 +403,7 @@ class TestDisplayWelcome:
     def test_plain_text_adds_to_history(self, display: Display):
         """Plain text welcome should be added to history."""
         display.welcome("Welcome!")
-        text = "".join(t for _, t in display.history.get_formatted_text())
+        text = display.history.plain_text
         assert "Welcome!" in text
 
     def test_rich_renderable_converted(self, display: Display):
@@ -402,7 +441,7 @@ class TestDisplayRaw:
     def test_adds_to_history(self, display: Display):
         """Raw content should be added to history."""
         display.raw("Raw content")
-        text = "".join(t for _, t in display.history.get_formatted_text())
+        text = display.history.plain_text
         assert "Raw content" in text
 
     def test_with_style_class(self, display: Display):
@@ -414,7 +453,6 @@ class TestDisplayRaw:
 
     def test_caches_raw_in_fullscreen(self, fullscreen_display: Display):
         """Raw without style should cache as ANSI."""
-        from prompt_toolkit.formatted_text import ANSI
         fullscreen_display.raw("Content")
         assert isinstance(fullscreen_display._pending_output[0], ANSI)
 
@@ -42,7 +42,7 @@ class TestFormattedTextHistoryBasics:
         formatted = history.get_formatted_text()
 
         assert isinstance(formatted, FormattedText)
-        assert len(list(formatted)) == 2
+        assert len(formatted) == 2
 
     def test_get_formatted_text_preserves_styles(
         self, history: FormattedTextHistory
@@ -52,10 +52,9 @@ class TestFormattedTextHistoryBasics:
         history.append("class:assistant", "Assistant text")
 
         formatted = history.get_formatted_text()
-        fragments = list(formatted)
 
-        assert fragments[0] == ("class:user", "User text")
-        assert fragments[1] == ("class:assistant", "Assistant text")
+        assert formatted[0] == ("class:user", "User text")
+        assert formatted[1] == ("class:assistant", "Assistant text")
 
     def test_clear_removes_all_fragments(self, history: FormattedTextHistory):
         """Clear should remove all fragments."""
@@ -100,6 +99,35 @@ class TestFormattedTextHistoryAppendFormatted:
         assert len(history) == 2
 
 
+class TestFormattedTextHistoryPlainText:
+    """Test plain_text property."""
+
+    def test_plain_text_empty(self, history: FormattedTextHistory):
+        """plain_text should be empty for empty history."""
+        assert history.plain_text == ""
+
+    def test_plain_text_concatenates_fragments(self, history: FormattedTextHistory):
+        """plain_text should join fragment text without styles."""
+        history.append("class:a", "Hello ")
+        history.append_formatted([("class:b", "World"), ("class:c", "!")])
+        assert history.plain_text == "Hello World!"
+
+    def test_plain_text_updates_after_read(self, history: FormattedTextHistory):
+        """Fragments added after a read should appear on the next read."""
+        history.append("class:a", "One")
+        assert history.plain_text == "One"
+        history.append("class:b", "Two")
+        assert history.plain_text == "OneTwo"
+
+    def test_plain_text_reset_on_clear(self, history: FormattedTextHistory):
+        """clear should reset plain_text."""
+        history.append("class:a", "One")
+        assert history.plain_text == "One"
+        history.clear()
+        history.append("class:b", "Two")
+        assert history.plain_text == "Two"
+
+
 class TestFormattedTextHistoryChangeNotification:
     """Test change notification callback."""
 
@@ -139,6 +167,14 @@ class TestFormattedTextHistoryChangeNotification:
         history.append("class:test", "Test")
         history.clear()
 
+    def test_on_change_removed_with_none(self, history: FormattedTextHistory):
+        """Setting the callback to None should stop notifications."""
+        changes = []
+        history.set_on_change(lambda: changes.append(True))
+        history.set_on_change(None)
+        history.append("class:test", "Test")
+        assert changes == []
+
 
 class TestFormattedTextHistoryEdgeCases:
     """Test edge cases."""
@@ -152,15 +188,13 @@ class TestFormattedTextHistoryEdgeCases:
         """Should handle empty style."""
         history.append("", "Text without style")
         formatted = history.get_formatted_text()
-        fragments = list(formatted)
-        assert fragments[0] == ("", "Text without style")
+        assert formatted[0] == ("", "Text without style")
 
     def test_unicode_content(self, history: FormattedTextHistory):
         """Should handle unicode content."""
         history.append("class:test", "Hello 世界 🌍")
         formatted = history.get_formatted_text()
-        fragments = list(formatted)
-        assert fragments[0][1] == "Hello 世界 🌍"
+        assert formatted[0][1] == "Hello 世界 🌍"
 
     def test_multiline_content(self, history: FormattedTextHistory):
         """Should handle multiline content."""
@@ -178,5 +212,17 @@ class TestFormattedTextHistoryEdgeCases:
         formatted2 = history.get_formatted_text()
 
         # First formatted text should not be affected by later additions
-        assert len(list(formatted1)) == 1
-        assert len(list(formatted2)) == 2
+        assert len(formatted1) == 1
+        assert len(formatted2) == 2
+
+    def test_get_formatted_text_reused_until_changed(
+        self, history: FormattedTextHistory
+    ):
+        """Unchanged history should return the same snapshot."""
+        history.append("class:test", "Original")
+        formatted = history.get_formatted_text()
+        assert history.get_formatted_text() is formatted
+
+        history.clear()
+        assert history.get_formatted_text() is not formatted
+        assert len(history.get_formatted_text()) == 0
@@ -0,0 +1,117 @@
+"""
+Tests for ThinkingPromptSession.
+"""
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+from prompt_toolkit.completion import WordCompleter
+from prompt_toolkit.filters import Condition
+
+from thinking_prompt import ThinkingPromptSession
+
+
+@pytest.fixture
+def session() -> ThinkingPromptSession:
+    """Create a session with no app info."""
+    return ThinkingPromptSession()
+
+
+@pytest.fixture
+def invalidations(session: ThinkingPromptSession, monkeypatch) -> List[bool]:
+    """Record calls that reach the application's full_screen update."""
+    calls: List[bool] = []
+
+    class _RecordingApp:
+        is_running = False
+
+        @property
+        def full_screen(self) -> bool:
+            return False
+
+        @full_screen.setter
+        def full_screen(self, value: bool) -> None:
+            calls.append(value)
+
+    monkeypatch.setattr(session, "app", _RecordingApp())
+    return calls
+
+
+class TestSessionCompleter:
+    """Test completer wiring."""
+
+    def test_completer_runs_inline_by_default(self):
+        """Completer should be passed to the buffer unwrapped."""
+        completer = WordCompleter(["help"])
+        session = ThinkingPromptSession(completer=completer)
+        assert session.default_buffer.completer is completer
+
+    def test_complete_while_typing_accepts_filter(self):
+        """complete_while_typing should accept a filter and pass it to the buffer."""
+        enabled = [False]
+        session = ThinkingPromptSession(
+            completer=WordCompleter(["help"]),
+            complete_while_typing=Condition(lambda: enabled[0]),
+        )
+        assert not session.default_buffer.complete_while_typing()
+        enabled[0] = True
+        assert session.default_buffer.complete_while_typing()
+
+
+class TestSessionRefresh:
+    """Test redraw rate configuration."""
+
+    def test_default_refresh_interval(self, session):
+        """Session should redraw every 0.1s by default."""
+        assert session.app.refresh_interval == 0.1
+
+    def test_custom_refresh_interval(self):
+        """refresh_interval should be passed to the application."""
+        session = ThinkingPromptSession(refresh_interval=1 / 30)
+        assert session.app.refresh_interval == 1 / 30
+
+    @pytest.mark.parametrize("refresh_interval", [0, -0.1, None])
+    def test_non_positive_refresh_interval_rejected(self, refresh_interval):
+        """refresh_interval must be positive, or thinking content would never redraw."""
+        with pytest.raises(ValueError, match="refresh_interval"):
+            ThinkingPromptSession(refresh_interval=refresh_interval)
+
+
+class TestSessionBatch:
+    """Test batched UI invalidation."""
+
+    def test_updates_outside_batch_invalidate_immediately(self, session, invalidations):
+        """Each update should refresh the UI when not batched."""
+        session.add_message("system", "one")
+        session.add_message("system", "two")
+        assert len(invalidations) == 2
+
+    def test_batch_coalesces_invalidations(self, session, invalidations):
+        """Updates inside a batch should refresh the UI once on exit."""
+        with session.batch():
+            session.add_message("system", "one")
+            session.add_message("system", "two")
+            assert invalidations == []
+        assert len(invalidations) == 1
+
+    def test_nested_batch_flushes_on_outermost_exit(self, session, invalidations):
+        """Only the outermost batch should trigger the refresh."""
+        with session.batch():
+            with session.batch():
+                session.add_message("system", "one")
+            assert invalidations == []
+        assert len(invalidations) == 1
+
+    def test_empty_batch_does_not_invalidate(self, session, invalidations):
+        """A batch with no updates should not refresh the UI."""
+        with session.batch():
+            pass
+        assert invalidations == []
+
+    def test_batch_flushes_on_exception(self, session, invalidations):
+        """Deferred refresh should still happen if the block raises."""
+        with pytest.raises(RuntimeError), session.batch():
+            session.add_message("system", "one")
+            raise RuntimeError("boom")
+        assert len(invalidations) == 1
@@ -1,164 +1,173 @@
 """Tests for the settings dialog system."""
 from __future__ import annotations
 
-from prompt_toolkit.layout import HSplit, Window
+from dataclasses import dataclass
 
+import pytest
+from prompt_toolkit.layout import DynamicContainer, HSplit
+
+from thinking_prompt import ThinkingPromptSession
 from thinking_prompt.settings_dialog import (
+    CheckboxControl,
     CheckboxItem,
     DropdownItem,
+    InlineSelectControl,
     InlineSelectItem,
     SettingsDialog,
+    TextControl,
     TextItem,
 )
 
 
+@dataclass(frozen=True)
+class RenderCase:
+    """A TextControl rendering case: item settings and expected substrings."""
+
+    default: str
+    password: bool
+    must_contain: tuple[str, ...]
+    must_not_contain: tuple[str, ...] = ()
+
+
+@pytest.fixture(scope="module")
+def settings_items() -> list:
+    """One item of each basic type, shared read-only across the module."""
+    return [
+        InlineSelectItem(key="model", label="Model", options=["a", "b"], default="a"),
+        CheckboxItem(key="stream", label="Stream", default=True),
+        TextItem(key="name", label="Name", default="test"),
+    ]
+
+
+def _build_settings_dialog(items: list) -> SettingsDialog:
+    """Create a SettingsDialog over items with its body built."""
+    dialog = SettingsDialog(title="Settings", items=items)
+    dialog.build_body()
+    return dialog
+
+
+@pytest.fixture(scope="module")
+def built_settings_dialog(settings_items: list) -> SettingsDialog:
+    """A built SettingsDialog shared by tests that only read from it."""
+    return _build_settings_dialog(settings_items)
+
+
+@pytest.fixture
+def settings_dialog(settings_items: list) -> SettingsDialog:
+    """A fresh built SettingsDialog for tests that change control values."""
+    return _build_settings_dialog(settings_items)
+
+
 class TestSettingsItems:
     """Tests for settings item types."""
 
-    def test_inline_select_item_creation(self):
-        """InlineSelectItem stores key, label, options, and default."""
-        item = InlineSelectItem(
-            key="model",
-            label="Model",
-            options=["gpt-4", "gpt-3.5"],
-            default="gpt-4",
-        )
-        assert item.key == "model"
-        assert item.label == "Model"
-        assert item.options == ["gpt-4", "gpt-3.5"]
-        assert item.default == "gpt-4"
-
-    def test_inline_select_item_with_description(self):
-        """InlineSelectItem can have a description."""
-        item = InlineSelectItem(
-            key="model",
-            label="Model",
-            description="Select the AI model to use",
-            options=["gpt-4", "gpt-3.5"],
-            default="gpt-4",
-        )
-        assert item.description == "Select the AI model to use"
-
-    def test_checkbox_item_creation(self):
-        """CheckboxItem stores key, label, and default bool."""
-        item = CheckboxItem(
-            key="stream",
-            label="Stream Output",
-            default=True,
-        )
-        assert item.key == "stream"
-        assert item.label == "Stream Output"
-        assert item.default is True
-
-    def test_checkbox_item_default_false(self):
-        """CheckboxItem defaults to False."""
-        item = CheckboxItem(key="debug", label="Debug")
-        assert item.default is False
-
-    def test_text_item_creation(self):
-        """TextItem stores key, label, default, and password flag."""
-        item = TextItem(
-            key="api_key",
-            label="API Key",
-            default="sk-xxx",
-            password=True,
-        )
-        assert item.key == "api_key"
-        assert item.label == "API Key"
-        assert item.default == "sk-xxx"
-        assert item.password is True
-
-    def test_text_item_defaults(self):
-        """TextItem has sensible defaults."""
-        item = TextItem(key="name", label="Name")
-        assert item.default == ""
-        assert item.password is False
+    @pytest.mark.parametrize("item_cls,kwargs,expected", [
+        pytest.param(
+            InlineSelectItem,
+            {"key": "model", "label": "Model", "options": ["gpt-4", "gpt-3.5"], "default": "gpt-4"},
+            {"key": "model", "label": "Model", "options": ["gpt-4", "gpt-3.5"], "default": "gpt-4"},
+            id="inline-select",
+        ),
+        pytest.param(
+            InlineSelectItem,
+            {"key": "model", "label": "Model", "description": "Select the AI model to use",
+             "options": ["gpt-4", "gpt-3.5"], "default": "gpt-4"},
+            {"description": "Select the AI model to use"},
+            id="inline-select-description",
+        ),
+        pytest.param(
+            DropdownItem,
+            {"key": "theme", "label": "Theme", "options": ["dark", "light"], "default": "dark"},
+            {"key": "theme", "label": "Theme", "options": ["dark", "light"], "default": "dark",
+             "height": 4, "width": 15, "max_width": None},
+            id="dropdown",
+        ),
+        pytest.param(
+            CheckboxItem,
+            {"key": "stream", "label": "Stream Output", "default": True},
+            {"key": "stream", "label": "Stream Output", "default": True},
+            id="checkbox",
+        ),
+        pytest.param(
+            CheckboxItem,
+            {"key": "debug", "label": "Debug"},
+            {"default": False},
+            id="checkbox-defaults",
+        ),
+        pytest.param(
+            TextItem,
+            {"key": "api_key", "label": "API Key", "default": "sk-xxx", "password": True},
+            {"key": "api_key", "label": "API Key", "default": "sk-xxx", "password": True},
+            id="text",
+        ),
+        pytest.param(
+            TextItem,
+            {"key": "name", "label": "Name"},
+            {"default": "", "password": False},
+            id="text-defaults",
+        ),
+    ])
+    def test_item_attributes(self, item_cls, kwargs, expected):
+        """Items store their fields and fill in sensible defaults."""
+        item = item_cls(**kwargs)
+        for name, value in expected.items():
+            assert getattr(item, name) == value
+            # bool fields must be real bools, not just truthy
+            if isinstance(value, bool):
+                assert getattr(item, name) is value
 
 
 class TestSettingsDialogState:
     """Tests for SettingsDialog state management."""
 
-    def test_settings_dialog_init_original_values(self):
+    def test_settings_dialog_init_original_values(self, built_settings_dialog):
         """SettingsDialog initializes original values from items."""
-        items = [
-            InlineSelectItem(key="model", label="Model", options=["a", "b"], default="a"),
-            CheckboxItem(key="stream", label="Stream", default=True),
-            TextItem(key="name", label="Name", default="test"),
-        ]
-        dialog = SettingsDialog(title="Settings", items=items)
+        assert built_settings_dialog._original_values == {"model": "a", "stream": True, "name": "test"}
 
-        assert dialog._original_values == {"model": "a", "stream": True, "name": "test"}
-
-    def test_settings_dialog_get_changed_values_empty(self):
+    def test_settings_dialog_get_changed_values_empty(self, built_settings_dialog):
         """No changes returns empty dict."""
-        items = [
-            InlineSelectItem(key="model", label="Model", options=["a", "b"], default="a"),
-        ]
-        dialog = SettingsDialog(title="Settings", items=items)
-        dialog.build_body()  # Creates the list control
-
-        changed = dialog._get_changed_values()
+        changed = built_settings_dialog._get_changed_values()
         assert changed == {}
 
-    def test_settings_dialog_get_changed_values_with_changes(self):
+    def test_settings_dialog_get_changed_values_with_changes(self, settings_dialog):
         """Changed values are returned correctly."""
-        items = [
-            InlineSelectItem(key="model", label="Model", options=["a", "b"], default="a"),
-            CheckboxItem(key="stream", label="Stream", default=True),
-        ]
-        dialog = SettingsDialog(title="Settings", items=items)
-        dialog.build_body()  # Creates the controls
-
         # Simulate user changing dropdown via control
-        dialog._controls[0].value = "b"
+        settings_dialog._controls[0].value = "b"
 
-        changed = dialog._get_changed_values()
+        changed = settings_dialog._get_changed_values()
         assert changed == {"model": "b"}
 
-    def test_settings_dialog_can_cancel_default_true(self):
-        """SettingsDialog has can_cancel=True by default."""
-        dialog = SettingsDialog(title="Settings", items=[])
-        assert dialog._can_cancel is True
-
-    def test_settings_dialog_can_cancel_false(self):
-        """SettingsDialog can disable cancel."""
-        dialog = SettingsDialog(title="Settings", items=[], can_cancel=False)
-        assert dialog._can_cancel is False
+    @pytest.mark.parametrize("kwargs,expected", [
+        pytest.param({}, True, id="default"),
+        pytest.param({"can_cancel": False}, False, id="disabled"),
+    ])
+    def test_settings_dialog_can_cancel(self, kwargs, expected):
+        """SettingsDialog allows cancel by default and can disable it."""
+        dialog = SettingsDialog(title="Settings", items=[], **kwargs)
+        assert dialog._can_cancel is expected
 
 
 class TestSettingsDialogLayout:
     """Tests for SettingsDialog layout."""
 
-    def test_build_body_returns_hsplit(self):
+    def test_build_body_returns_hsplit(self, settings_items):
         """build_body returns an HSplit of control containers."""
-        items = [
-            InlineSelectItem(key="model", label="Model", options=["a", "b"], default="a"),
-            CheckboxItem(key="stream", label="Stream", default=True),
-        ]
-        dialog = SettingsDialog(title="Settings", items=items)
+        dialog = SettingsDialog(title="Settings", items=settings_items)
         body = dialog.build_body()
 
         # Should be an HSplit of control containers
         assert isinstance(body, HSplit)
 
-    def test_build_body_creates_controls(self):
-        """build_body creates individual SettingControl instances."""
-        from thinking_prompt.settings_dialog import (
-            CheckboxControl, InlineSelectControl, TextControl
-        )
-
-        items = [
-            InlineSelectItem(key="model", label="Model", options=["a", "b"], default="a"),
-            CheckboxItem(key="stream", label="Stream", default=True),
-            TextItem(key="name", label="Name", default="test"),
-        ]
-        dialog = SettingsDialog(title="Settings", items=items)
+    @pytest.mark.parametrize("order", [[0, 1, 2], [1, 0, 2]], ids=["select_first", "checkbox_first"])
+    def test_build_body_creates_controls(self, settings_items, order):
+        """build_body creates one SettingControl per item, in item order."""
+        control_types = [InlineSelectControl, CheckboxControl, TextControl]
+        dialog = SettingsDialog(title="Settings", items=[settings_items[i] for i in order])
         dialog.build_body()
 
         assert len(dialog._controls) == 3
-        assert isinstance(dialog._controls[0], InlineSelectControl)
-        assert isinstance(dialog._controls[1], CheckboxControl)
-        assert isinstance(dialog._controls[2], TextControl)
+        for control, i in zip(dialog._controls, order):
+            assert isinstance(control, control_types[i])
 
 
 class TestSessionIntegration:
@@ -188,8 +197,6 @@ class TestSettingControl:
 
     def test_setting_control_stores_item_and_value(self):
         """SettingControl stores item reference and initial value."""
-        from thinking_prompt.settings_dialog import CheckboxControl
-
         item = CheckboxItem(key="stream", label="Stream", default=True)
         control = CheckboxControl(item)
 
@@ -198,8 +205,6 @@ class TestSettingControl:
 
     def test_setting_control_is_not_editing_by_default(self):
         """SettingControl starts in view mode."""
-        from thinking_prompt.settings_dialog import CheckboxControl
-
         item = CheckboxItem(key="stream", label="Stream", default=False)
         control = CheckboxControl(item)
 
@@ -211,8 +216,6 @@ class TestCheckboxControl:
 
     def test_checkbox_control_tracks_focus(self):
         """CheckboxControl updates _has_focus based on actual focus."""
-        from thinking_prompt.settings_dialog import CheckboxControl
-
         item = CheckboxItem(key="stream", label="Stream", default=False)
         control = CheckboxControl(item)
 
@@ -226,8 +229,6 @@ class TestCheckboxControl:
 
     def test_checkbox_toggle(self):
         """Checkbox toggles value."""
-        from thinking_prompt.settings_dialog import CheckboxControl
-
         item = CheckboxItem(key="stream", label="Stream", default=False)
         control = CheckboxControl(item)
 
@@ -237,16 +238,12 @@ class TestCheckboxControl:
         control.toggle()
         assert control.value is False
 
-    def test_checkbox_renders_label_and_value(self):
+    def test_checkbox_renders_label_and_value(self, render_text):
         """Checkbox renders label and true/false value."""
-        from thinking_prompt.settings_dialog import CheckboxControl
-
         item = CheckboxItem(key="stream", label="Stream Output", default=True)
         control = CheckboxControl(item)
 
-        content = control.create_content(width=50, height=1)
-        line = content.get_line(0)
-        text = "".join(t[1] for t in line)
+        text = render_text(control)
 
         assert "Stream Output" in text
         assert "true" in text
@@ -255,41 +252,39 @@ class TestCheckboxControl:
 class TestInlineSelectControl:
     """Tests for InlineSelectControl."""
 
-    def test_inline_select_cycle_forward(self):
-        """InlineSelect cycles through options forward."""
-        from thinking_prompt.settings_dialog import InlineSelectControl
-
+    @pytest.mark.parametrize("steps,expected", [
+        pytest.param([1, 1, 1], ["b", "c", "c"], id="forward_clamped_at_end"),
+        pytest.param([-1], ["a"], id="backward_clamped_at_start"),
+        pytest.param([1, 1, -1, -1, -1], ["b", "c", "b", "a", "a"], id="mixed"),
+    ])
+    def test_inline_select_cycle(self, steps, expected):
+        """InlineSelect moves through options by delta, clamped to the ends."""
         item = InlineSelectItem(key="model", label="Model", options=["a", "b", "c"], default="a")
         control = InlineSelectControl(item)
 
         assert control.value == "a"
-        control.cycle(1)
-        assert control.value == "b"
-        control.cycle(1)
-        assert control.value == "c"
-        control.cycle(1)
-        assert control.value == "c"  # clamped at end
-
-    def test_inline_select_cycle_backward(self):
-        """InlineSelect cycles through options backward."""
-        from thinking_prompt.settings_dialog import InlineSelectControl
-
-        item = InlineSelectItem(key="model", label="Model", options=["a", "b", "c"], default="a")
+        for step, value in zip(steps, expected):
+            control.cycle(step)
+            assert control.value == value
+
+    @pytest.mark.parametrize("options,default,delta,expected", [
+        pytest.param(["a", "b", "c"], "z", 1, "b", id="unknown-value-starts-at-first"),
+        pytest.param([], "z", 1, "z", id="no-options-unchanged"),
+    ])
+    def test_inline_select_cycle_edge_cases(self, options, default, delta, expected):
+        """cycle treats an unknown value as the first option and ignores empty options."""
+        item = InlineSelectItem(key="model", label="Model", options=options, default=default)
         control = InlineSelectControl(item)
 
-        control.cycle(-1)
-        assert control.value == "a"  # clamped at start
+        control.cycle(delta)
+        assert control.value == expected
 
-    def test_inline_select_renders_label_and_value(self):
+    def test_inline_select_renders_label_and_value(self, render_text):
         """InlineSelect renders label and current option."""
-        from thinking_prompt.settings_dialog import InlineSelectControl
-
         item = InlineSelectItem(key="model", label="Model", options=["gpt-4", "gpt-3.5"], default="gpt-4")
         control = InlineSelectControl(item)
 
-        content = control.create_content(width=50, height=1)
-        line = content.get_line(0)
-        text = "".join(t[1] for t in line)
+        text = render_text(control)
 
         assert "Model" in text
         assert "gpt-4" in text
@@ -300,8 +295,6 @@ class TestTextControl:
 
     def test_text_control_enter_edit_mode(self):
         """TextControl enters edit mode and populates buffer."""
-        from thinking_prompt.settings_dialog import TextControl
-
         item = TextItem(key="name", label="Name", default="Alice")
         control = TextControl(item)
 
@@ -312,8 +305,6 @@ class TestTextControl:
 
     def test_text_control_confirm_edit(self):
         """TextControl confirm saves buffer value."""
-        from thinking_prompt.settings_dialog import TextControl
-
         item = TextItem(key="name", label="Name", default="Alice")
         control = TextControl(item)
 
@@ -326,8 +317,6 @@ class TestTextControl:
 
     def test_text_control_cancel_edit(self):
         """TextControl cancel restores original value."""
-        from thinking_prompt.settings_dialog import TextControl
-
         item = TextItem(key="name", label="Name", default="Alice")
         control = TextControl(item)
 
@@ -338,52 +327,25 @@ class TestTextControl:
         assert control.is_editing is False
         assert control.value == "Alice"  # restored
 
-    def test_text_control_renders_value(self):
-        """TextControl renders label and value in view mode."""
-        from thinking_prompt.settings_dialog import TextControl
-
-        item = TextItem(key="name", label="Name", default="Alice")
-        control = TextControl(item)
-
-        content = control.create_content(width=50, height=1)
-        line = content.get_line(0)
-        text = "".join(t[1] for t in line)
-
-        assert "Name" in text
-        assert "Alice" in text
-
-    def test_text_control_renders_empty_placeholder(self):
-        """TextControl shows (empty) for empty value."""
-        from thinking_prompt.settings_dialog import TextControl
-
-        item = TextItem(key="name", label="Name", default="")
+    @pytest.mark.parametrize("case", [
+        pytest.param(RenderCase("Alice", False, ("Name", "Alice")), id="plain"),
+        pytest.param(RenderCase("", False, ("(empty)",)), id="empty-placeholder"),
+        pytest.param(RenderCase("sk-secret", True, ("••••••",), ("sk-secret",)), id="password-masked"),
+    ])
+    def test_text_control_renders(self, case: RenderCase, render_text):
+        """TextControl renders the label and value, a placeholder, or a mask."""
+        item = TextItem(key="name", label="Name", default=case.default, password=case.password)
         control = TextControl(item)
 
-        content = control.create_content(width=50, height=1)
-        line = content.get_line(0)
-        text = "".join(t[1] for t in line)
-
-        assert "(empty)" in text
+        text = render_text(control)
 
-    def test_text_control_renders_password_masked(self):
-        """TextControl masks password values."""
-        from thinking_prompt.settings_dialog import TextControl
-
-        item = TextItem(key="api_key", label="API Key", default="sk-secret", password=True)
-        control = TextControl(item)
-
-        content = control.create_content(width=50, height=1)
-        line = content.get_line(0)
-        text = "".join(t[1] for t in line)
-
-        assert "sk-secret" not in text
-        assert "••••••" in text
+        for expected in case.must_contain:
+            assert expected in text
+        for unexpected in case.must_not_contain:
+            assert unexpected not in text
 
     def test_text_control_container_switches_in_edit_mode(self):
         """TextControl container returns different content in edit mode."""
-        from thinking_prompt.settings_dialog import TextControl
-        from prompt_toolkit.layout import DynamicContainer
-
         item = TextItem(key="name", label="Name", default="Alice")
         control = TextControl(item)
 
@@ -397,38 +359,4 @@ class TestShowSettingsDialog:
 
     def test_session_has_show_settings_dialog_method(self):
         """ThinkingPromptSession has show_settings_dialog method."""
-        from thinking_prompt import ThinkingPromptSession
         assert hasattr(ThinkingPromptSession, 'show_settings_dialog')
-
-
-class TestSettingsDialogRefactored:
-    """Tests for refactored SettingsDialog using individual controls."""
-
-    def test_settings_dialog_creates_controls(self):
-        """SettingsDialog creates SettingControl instances."""
-        from thinking_prompt.settings_dialog import (
-            CheckboxControl, InlineSelectControl, TextControl
-        )
-
-        items = [
-            CheckboxItem(key="stream", label="Stream", default=True),
-            InlineSelectItem(key="model", label="Model", options=["a", "b"], default="a"),
-            TextItem(key="name", label="Name", default="test"),
-        ]
-        dialog = SettingsDialog(title="Settings", items=items)
-        dialog.build_body()
-
-        assert len(dialog._controls) == 3
-        assert isinstance(dialog._controls[0], CheckboxControl)
-        assert isinstance(dialog._controls[1], InlineSelectControl)
-        assert isinstance(dialog._controls[2], TextControl)
-
-    def test_settings_dialog_build_body_returns_hsplit(self):
-        """build_body returns HSplit of control containers."""
-        items = [
-            CheckboxItem(key="stream", label="Stream", default=True),
-        ]
-        dialog = SettingsDialog(title="Settings", items=items)
-        body = dialog.build_body()
-
-        assert isinstance(body, HSplit)
@@ -3,12 +3,40 @@ Tests for ThinkingBoxControl.
 """
 from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import Optional
+
 import pytest
 from prompt_toolkit.formatted_text import FormattedText
 
 from thinking_prompt.thinking import ThinkingBoxControl
 
 
+@dataclass(frozen=True)
+class ToggleCase:
+    """A can_toggle_expanded case: which control, its content, and the result."""
+
+    control_fixture: str
+    content_fixture: Optional[str]
+    expand: bool = False
+    expected: bool = False
+
+
+@pytest.fixture
+def whitespace_content() -> str:
+    """Content made only of spaces and newlines."""
+    return "   \n  \n  "
+
+
+def _start(control, request, content_fixture, expand=False):
+    """Start control with the named content fixture, if any, then expand."""
+    if content_fixture is not None:
+        content = request.getfixturevalue(content_fixture)
+        control.start(lambda: content)
+    if expand:
+        control.expand()
+
+
 class TestThinkingBoxControlBasics:
     """Test basic functionality of ThinkingBoxControl."""
 
@@ -18,38 +46,35 @@ class TestThinkingBoxControlBasics:
         assert not thinking_control.is_expanded
         assert thinking_control.content == ""
 
-    def test_start_activates_control(self, thinking_control: ThinkingBoxControl):
-        """Starting should activate the control."""
-        thinking_control.start(lambda: "test content")
-        assert thinking_control.is_active
-
-    def test_start_sets_content_callback(self, thinking_control: ThinkingBoxControl):
-        """Starting should set the content callback."""
-        thinking_control.start(lambda: "hello world")
-        assert thinking_control.content == "hello world"
+    @pytest.mark.parametrize(
+        "started_control,expected",
+        [("test content", "test content"), ("hello world", "hello world")],
+        indirect=["started_control"],
+    )
+    def test_start_and_finish_flow(
+        self, started_control: ThinkingBoxControl, expected: str
+    ):
+        """Starting activates the control; finishing returns content and state."""
+        assert started_control.is_active
+        assert started_control.content == expected
 
-    def test_finish_returns_content_and_state(self, thinking_control: ThinkingBoxControl):
-        """Finishing should return content and expansion state."""
-        thinking_control.start(lambda: "test content")
-        content, was_expanded = thinking_control.finish()
+        content, was_expanded = started_control.finish()
 
-        assert content == "test content"
+        assert content == expected
         assert not was_expanded
 
-    def test_finish_resets_state(self, thinking_control: ThinkingBoxControl):
+    def test_finish_resets_state(self, started_control: ThinkingBoxControl):
         """Finishing should reset the control to inactive state."""
-        thinking_control.start(lambda: "test")
-        thinking_control.finish()
+        started_control.finish()
 
-        assert not thinking_control.is_active
-        assert not thinking_control.is_expanded
-        assert thinking_control.content == ""
+        assert not started_control.is_active
+        assert not started_control.is_expanded
+        assert started_control.content == ""
 
-    def test_finish_returns_expanded_state(self, thinking_control: ThinkingBoxControl):
+    def test_finish_returns_expanded_state(self, started_control: ThinkingBoxControl):
         """Finishing should return True for was_expanded if expanded."""
-        thinking_control.start(lambda: "test")
-        thinking_control.expand()
-        content, was_expanded = thinking_control.finish()
+        started_control.expand()
+        content, was_expanded = started_control.finish()
 
         assert was_expanded
 
@@ -66,99 +91,76 @@ class TestThinkingBoxControlBasics:
 class TestThinkingBoxControlExpansion:
     """Test expansion/collapse functionality."""
 
-    def test_expand_sets_expanded(self, thinking_control: ThinkingBoxControl):
+    def test_expand_sets_expanded(self, started_control: ThinkingBoxControl):
         """Expand should set is_expanded to True."""
-        thinking_control.start(lambda: "test")
-        thinking_control.expand()
-        assert thinking_control.is_expanded
+        started_control.expand()
+        assert started_control.is_expanded
 
-    def test_collapse_clears_expanded(self, thinking_control: ThinkingBoxControl):
+    def test_collapse_clears_expanded(self, started_control: ThinkingBoxControl):
         """Collapse should set is_expanded to False."""
-        thinking_control.start(lambda: "test")
-        thinking_control.expand()
-        thinking_control.collapse()
-        assert not thinking_control.is_expanded
+        started_control.expand()
+        started_control.collapse()
+        assert not started_control.is_expanded
 
-    def test_toggle_switches_state(self, thinking_control: ThinkingBoxControl):
+    def test_toggle_switches_state(self, started_control: ThinkingBoxControl):
         """Toggle should switch expanded state."""
-        thinking_control.start(lambda: "test")
-
-        assert not thinking_control.is_expanded
-        thinking_control.toggle_expanded()
-        assert thinking_control.is_expanded
-        thinking_control.toggle_expanded()
-        assert not thinking_control.is_expanded
-
-    def test_can_toggle_when_expanded(self, thinking_control: ThinkingBoxControl):
-        """Should be able to toggle when already expanded."""
-        thinking_control.start(lambda: "test")
-        thinking_control.expand()
-        assert thinking_control.can_toggle_expanded
-
-    def test_cannot_toggle_when_inactive(self, thinking_control: ThinkingBoxControl):
-        """Should not be able to toggle when inactive."""
-        assert not thinking_control.can_toggle_expanded
-
-    def test_can_toggle_when_content_overflows(
-        self, small_thinking_control: ThinkingBoxControl, multiline_content: str
-    ):
-        """Should be able to toggle when content overflows max lines."""
-        small_thinking_control.start(lambda: multiline_content)
-        assert small_thinking_control.can_toggle_expanded
-
-    def test_cannot_toggle_when_content_fits(
-        self, small_thinking_control: ThinkingBoxControl, short_content: str
-    ):
-        """Should not be able to toggle when content fits in collapsed view."""
-        small_thinking_control.start(lambda: short_content)
-        assert not small_thinking_control.can_toggle_expanded
+        assert not started_control.is_expanded
+        started_control.toggle_expanded()
+        assert started_control.is_expanded
+        started_control.toggle_expanded()
+        assert not started_control.is_expanded
+
+    @pytest.mark.parametrize("case", [
+        pytest.param(ToggleCase("thinking_control", None), id="inactive"),
+        pytest.param(ToggleCase("thinking_control", "short_content", expand=True, expected=True), id="expanded"),
+        pytest.param(ToggleCase("small_thinking_control", "multiline_content", expected=True), id="overflows"),
+        pytest.param(ToggleCase("small_thinking_control", "short_content"), id="fits"),
+    ])
+    def test_can_toggle_expanded(self, request, case: ToggleCase):
+        """Toggle is available when expanded or when content overflows."""
+        control = request.getfixturevalue(case.control_fixture)
+        _start(control, request, case.content_fixture, case.expand)
+
+        assert control.can_toggle_expanded is case.expected
 
 
 class TestThinkingBoxControlTruncation:
     """Test content truncation in collapsed mode."""
 
-    def test_console_output_truncated_when_collapsed(
-        self, small_thinking_control: ThinkingBoxControl, multiline_content: str
-    ):
-        """Console output should be truncated when collapsed and overflowing."""
-        small_thinking_control.start(lambda: multiline_content)
-        output = small_thinking_control.get_console_output()
-
-        assert output.endswith("...")
+    @pytest.mark.parametrize("content_fixture,expand,truncated,must_contain,newlines", [
         # max_collapsed_lines - 1 lines of content + "..."
-        assert output.count("\n") <= 4
-
-    def test_console_output_full_when_expanded(
-        self, small_thinking_control: ThinkingBoxControl, multiline_content: str
-    ):
-        """Console output should be full content when expanded."""
-        small_thinking_control.start(lambda: multiline_content)
-        small_thinking_control.expand()
-        output = small_thinking_control.get_console_output()
-
-        assert not output.endswith("...")
-        assert "Line 19" in output  # Last line should be present
-
-    def test_console_output_not_truncated_when_fits(
-        self, small_thinking_control: ThinkingBoxControl, short_content: str
+        pytest.param("multiline_content", False, True, "Line 3", 4, id="collapsed-overflow"),
+        # Last line should be present
+        pytest.param("multiline_content", True, False, "Line 19", 19, id="expanded"),
+        pytest.param("short_content", False, False, "Line 2", 2, id="fits"),
+    ])
+    def test_console_output(
+        self,
+        request,
+        small_thinking_control: ThinkingBoxControl,
+        content_fixture,
+        expand,
+        truncated,
+        must_contain,
+        newlines,
     ):
-        """Console output should not be truncated when content fits."""
-        small_thinking_control.start(lambda: short_content)
+        """Console output is truncated only when collapsed and overflowing."""
+        _start(small_thinking_control, request, content_fixture, expand)
         output = small_thinking_control.get_console_output()
 
-        assert not output.endswith("...")
+        assert output.endswith("...") is truncated
+        assert must_contain in output
+        assert output.count("\n") == newlines
 
-    def test_console_output_empty_when_inactive(
-        self, thinking_control: ThinkingBoxControl
+    @pytest.mark.parametrize("content_fixture", [
+        pytest.param(None, id="inactive"),
+        pytest.param("whitespace_content", id="whitespace"),
+    ])
+    def test_console_output_empty(
+        self, request, thinking_control: ThinkingBoxControl, content_fixture
     ):
-        """Console output should be empty when inactive."""
-        assert thinking_control.get_console_output() == ""
-
-    def test_console_output_empty_when_whitespace_only(
-        self, thinking_control: ThinkingBoxControl
-    ):
-        """Console output should be empty when content is whitespace only."""
-        thinking_control.start(lambda: "   \n  \n  ")
+        """Console output should be empty when inactive or whitespace only."""
+        _start(thinking_control, request, content_fixture)
         assert thinking_control.get_console_output() == ""
 
 
@@ -173,75 +175,68 @@ class TestThinkingBoxControlFormatting:
         assert formatted == FormattedText([])
 
     def test_formatted_text_includes_content(
-        self, thinking_control: ThinkingBoxControl
+        self, thinking_control: ThinkingBoxControl, render_text
     ):
         """Formatted text should include content."""
         thinking_control.start(lambda: "Hello World")
         formatted = thinking_control._get_formatted_text()
 
-        # Extract text from formatted output
-        text = "".join(frag[1] for frag in formatted)
+        text = render_text(formatted)
         assert "Hello World" in text
 
     def test_formatted_text_includes_hint_when_overflowing(
-        self, small_thinking_control: ThinkingBoxControl, multiline_content: str
+        self, small_thinking_control: ThinkingBoxControl, multiline_content: str,
+        render_text,
     ):
         """Formatted text should include expand hint when collapsed and overflowing."""
         small_thinking_control.start(lambda: multiline_content)
         formatted = small_thinking_control._get_formatted_text()
 
-        text = "".join(frag[1] for frag in formatted)
+        text = render_text(formatted)
         # Default key is c-t, displayed as ctrl-t
         assert "ctrl-t to expand" in text
 
     def test_formatted_text_no_hint_when_expanded(
-        self, small_thinking_control: ThinkingBoxControl, multiline_content: str
+        self, small_thinking_control: ThinkingBoxControl, multiline_content: str,
+        render_text,
     ):
         """Formatted text should not include hint when expanded."""
         small_thinking_control.start(lambda: multiline_content)
         small_thinking_control.expand()
         formatted = small_thinking_control._get_formatted_text()
 
-        text = "".join(frag[1] for frag in formatted)
+        text = render_text(formatted)
         assert "to expand" not in text
 
-    def test_formatted_text_uses_custom_key_in_hint(self, multiline_content: str):
+    def test_formatted_text_uses_custom_key_in_hint(
+        self, multiline_content: str, render_text
+    ):
         """Formatted text should use custom key in expand hint."""
         control = ThinkingBoxControl(max_collapsed_lines=3, expand_key="c-x")
         control.start(lambda: multiline_content)
         formatted = control._get_formatted_text()
 
-        text = "".join(frag[1] for frag in formatted)
+        text = render_text(formatted)
         assert "ctrl-x to expand" in text
 
 
 class TestThinkingBoxControlLineCount:
     """Test line count calculation."""
 
-    def test_line_count_zero_when_empty(self, thinking_control: ThinkingBoxControl):
-        """Line count should be zero when no content."""
-        assert thinking_control.get_line_count() == 0
-
-    def test_line_count_counts_newlines(self, thinking_control: ThinkingBoxControl):
-        """Line count should count newlines correctly."""
-        thinking_control.start(lambda: "line1\nline2\nline3")
-        assert thinking_control.get_line_count() == 3
-
-    def test_line_count_accounts_for_wrapping(
-        self, thinking_control: ThinkingBoxControl
-    ):
-        """Line count should account for line wrapping."""
+    @pytest.mark.parametrize("content,width,expected", [
+        pytest.param(None, 80, 0, id="empty"),
+        pytest.param("line1\nline2\nline3", 80, 3, id="newlines"),
         # 100 chars should wrap at width 80
-        long_line = "x" * 100
-        thinking_control.start(lambda: long_line)
-        assert thinking_control.get_line_count(width=80) == 2
-
-    def test_line_count_handles_empty_lines(
-        self, thinking_control: ThinkingBoxControl
+        pytest.param("x" * 100, 80, 2, id="wraps"),
+        pytest.param("line1\n\nline3", 80, 3, id="blank-line"),
+    ])
+    def test_line_count(
+        self, thinking_control: ThinkingBoxControl, content, width, expected
     ):
-        """Line count should handle empty lines."""
-        thinking_control.start(lambda: "line1\n\nline3")
-        assert thinking_control.get_line_count() == 3
+        """Line count counts newlines, blank lines and wrapped lines."""
+        if content is not None:
+            thinking_control.start(lambda: content)
+        assert thinking_control.get_line_count(width=width) == expected
 
 
 class TestThinkingBoxControlKeyBindings:
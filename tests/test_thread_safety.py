@@ -46,7 +46,7 @@ class TestFormattedTextHistoryThreadSafety:
         def reader():
             while not stop_event.is_set():
                 formatted = history.get_formatted_text()
-                read_results.append(len(list(formatted)))
+                read_results.append(len(formatted))
                 time.sleep(0.001)
 
         writer_thread = threading.Thread(target=writer)
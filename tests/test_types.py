@@ -10,6 +10,8 @@ import time
 import pytest
 
 from thinking_prompt import StreamingContent
+from thinking_prompt.thinking import ThinkingBoxControl
+from thinking_prompt.types import truncate_to_lines
 
 
 class TestStreamingContentBasics:
@@ -44,6 +46,57 @@ class TestStreamingContentBasics:
         assert content.text == content.get_content()
         assert content.text == "Test"
 
+    def test_extend_appends_all_chunks(self):
+        """extend should append each chunk in order."""
+        content = StreamingContent()
+        content.append("A")
+        content.extend(["B", "C"])
+        assert content.get_content() == "ABC"
+        assert len(content) == 3
+
+    def test_replace_last_swaps_latest_chunk(self):
+        """replace_last should overwrite only the most recent chunk."""
+        content = StreamingContent()
+        content.append("Header\n")
+        content.append("[..  ] 50%\n")
+        content.replace_last("[....] 100%\n")
+        assert content.get_content() == "Header\n[....] 100%\n"
+        assert len(content) == 2
+
+    def test_replace_last_on_empty_appends(self):
+        """replace_last on empty content should behave like append."""
+        content = StreamingContent()
+        content.replace_last("First")
+        assert content.get_content() == "First"
+        assert len(content) == 1
+
+    def test_get_content_reuses_result_until_changed(self):
+        """Repeated reads should return the same string until content changes."""
+        content = StreamingContent()
+        content.append("Hello")
+        first = content.get_content()
+        assert content.get_content() is first
+        content.append(" World")
+        assert content.get_content() == "Hello World"
+        content.replace_last("!")
+        assert content.get_content() == "Hello!"
+        content.clear()
+        assert content.get_content() == ""
+
+    def test_get_content_interleaved_with_appends(self):
+        """Reads between appends should see every chunk exactly once."""
+        content = StreamingContent()
+        expected = ""
+        for i in range(50):
+            content.append(f"{i},")
+            expected += f"{i},"
+            assert content.get_content() == expected
+        content.extend(["a", "b"])
+        assert content.get_content() == expected + "ab"
+        content.replace_last("c")
+        content.append("d")
+        assert content.get_content() == expected + "acd"
+
     def test_clear_removes_all(self):
         """Clear should remove all content."""
         content = StreamingContent()
@@ -140,8 +193,6 @@ class TestStreamingContentWithThinkingControl:
 
     def test_as_content_callback(self):
         """Should work as a content callback for ThinkingBoxControl."""
-        from thinking_prompt.thinking import ThinkingBoxControl
-
         content = StreamingContent()
         control = ThinkingBoxControl()
 
@@ -156,8 +207,6 @@ class TestStreamingContentWithThinkingControl:
 
     def test_streaming_simulation(self):
         """Should handle streaming-like updates."""
-        from thinking_prompt.thinking import ThinkingBoxControl
-
         content = StreamingContent()
         control = ThinkingBoxControl()
 
@@ -171,3 +220,24 @@ class TestStreamingContentWithThinkingControl:
         assert control.content == "Hello world!\nHow are you?"
 
         control.finish()
+
+
+class TestTruncateToLines:
+    """Test truncate_to_lines helper."""
+
+    def test_short_content_unchanged(self):
+        """Content within the limit should only be right-stripped."""
+        assert truncate_to_lines("a\nb\n", 3) == "a\nb"
+
+    def test_exactly_max_lines_unchanged(self):
+        """Content with exactly max_lines lines should not be truncated."""
+        assert truncate_to_lines("a\nb\nc", 3) == "a\nb\nc"
+
+    def test_long_content_truncated(self):
+        """Content over the limit should keep the first lines plus suffix."""
+        content = "\n".join(f"Line {i}" for i in range(10))
+        assert truncate_to_lines(content, 3) == "Line 0\nLine 1\nLine 2\n..."
+
+    def test_custom_suffix(self):
+        """Custom suffix should be appended when truncated."""
+        assert truncate_to_lines("a\nb\nc", 2, suffix="[more]") == "a\nb\n[more]"
@@ -10,7 +10,9 @@ markdown, syntax highlighting, and Rich renderables.
 """
 from __future__ import annotations
 
+import shutil
 import threading
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Callable, List, Optional
 
 from prompt_toolkit import print_formatted_text
@@ -28,13 +30,22 @@ if TYPE_CHECKING:
 # Rich and Pygments Integration Helpers
 # =============================================================================
 
+# Built-in types that never implement the Rich protocol
+_PLAIN_TYPES = frozenset({str, int, float, bytes, type(None)})
+
+
 def _is_rich_renderable(obj: Any) -> bool:
     """Check if an object is a Rich renderable."""
+    if type(obj) in _PLAIN_TYPES:
+        return False
     return hasattr(obj, '__rich_console__') or hasattr(obj, '__rich__')
 
 
 def _rich_to_ansi(renderable: Any, theme: Any = None) -> str:
     """Convert a Rich renderable to an ANSI-formatted string."""
+    # Nothing to render; skip setting up a Console
+    if renderable is None:
+        return ""
     try:
         from rich.console import Console
         from io import StringIO
@@ -81,19 +92,30 @@ _setup_simple_heading()
 
 def _markdown_to_ansi(content: str, theme: Any = None) -> str:
     """Convert markdown to ANSI-formatted string using Rich."""
+    if not content:
+        return ""
+    # Rich wraps to this width, so it is part of the cache key
+    return _render_markdown(content, theme, shutil.get_terminal_size().columns)
+
+
+@lru_cache(maxsize=256)
+def _render_markdown(content: str, theme: Any, columns: int) -> str:
+    """Render markdown to ANSI; cached by content, theme and terminal width."""
     try:
         from rich.console import Console
         from rich.markdown import Markdown
         from io import StringIO
 
         file = StringIO()
-        console = Console(file=file, force_terminal=True, theme=theme)
+        # Render at the cached width rather than letting Rich detect its own
+        console = Console(file=file, force_terminal=True, theme=theme, width=columns)
         console.print(Markdown(content))
         return file.getvalue()
     except ImportError:
         return content
 
 
+@lru_cache(maxsize=256)
 def _highlight_code(code: str, language: str = "python") -> str:
     """Syntax highlight code using Pygments."""
     try:
@@ -229,7 +251,7 @@ class Display:
             add_to_history: If True, add to history.
             echo_to_console: If True, print to console.
         """
-        if not content.strip():
+        if not content or content.isspace():
             return
 
         style = "class:history.thinking"
@@ -398,8 +420,8 @@ class Display:
         Call this when exiting fullscreen mode to output content that was
         cached during fullscreen.
         """
+        # Swap in a fresh list rather than copying, and print outside the lock
         with self._pending_lock:
-            pending = list(self._pending_output)
-            self._pending_output.clear()
+            pending, self._pending_output = self._pending_output, []
         for content in pending:
             print_formatted_text(content, style=self._style)
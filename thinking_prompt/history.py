@@ -11,6 +11,10 @@ from typing import Callable, List, Optional, Tuple, Union
 from prompt_toolkit.formatted_text import FormattedText
 
 
+def _no_change_callback() -> None:
+    """Default change callback, so changes can notify unconditionally."""
+
+
 class FormattedTextHistory:
     """
     Thread-safe history of formatted text fragments.
@@ -32,17 +36,17 @@ class FormattedTextHistory:
 
     def __init__(self) -> None:
         self._fragments: List[Tuple[str, str]] = []
+        # Snapshot returned by get_formatted_text(), dropped on any change
+        self._snapshot: Optional[FormattedText] = None
+        # Text of the first _plain_count fragments, extended on read
+        self._plain_text = ""
+        self._plain_count = 0
         self._lock = threading.RLock()
-        self._on_change: Optional[Callable[[], None]] = None
+        self._on_change: Callable[[], None] = _no_change_callback
 
-    def set_on_change(self, callback: Callable[[], None]) -> None:
-        """Set callback to trigger when history changes."""
-        self._on_change = callback
-
-    def _notify_change(self) -> None:
-        """Notify that history has changed."""
-        if self._on_change:
-            self._on_change()
+    def set_on_change(self, callback: Optional[Callable[[], None]]) -> None:
+        """Set callback to trigger when history changes (None to remove it)."""
+        self._on_change = callback or _no_change_callback
 
     def append(self, style: str, text: str) -> None:
         """
@@ -54,7 +58,8 @@ class FormattedTextHistory:
         """
         with self._lock:
             self._fragments.append((style, text))
-            self._notify_change()
+            self._snapshot = None
+            self._on_change()
 
     def append_formatted(
         self, formatted: Union[FormattedText, List[Tuple[str, str]]]
@@ -67,23 +72,47 @@ class FormattedTextHistory:
         """
         with self._lock:
             self._fragments.extend(formatted)
-            self._notify_change()
+            self._snapshot = None
+            self._on_change()
 
     def get_formatted_text(self) -> FormattedText:
         """
         Get all fragments as FormattedText.
 
+        The fullscreen view calls this on every redraw, so the same snapshot
+        is returned until the history changes. Treat it as read-only.
+
         Returns:
             FormattedText containing all stored fragments.
         """
         with self._lock:
-            return FormattedText(list(self._fragments))
+            if self._snapshot is None:
+                self._snapshot = FormattedText(list(self._fragments))
+            return self._snapshot
+
+    @property
+    def plain_text(self) -> str:
+        """
+        All fragment text concatenated, without styles.
+
+        Only fragments added since the last read are joined.
+        """
+        with self._lock:
+            if self._plain_count < len(self._fragments):
+                self._plain_text += "".join(
+                    fragment[1] for fragment in self._fragments[self._plain_count:]
+                )
+                self._plain_count = len(self._fragments)
+            return self._plain_text
 
     def clear(self) -> None:
         """Clear all fragments."""
         with self._lock:
             self._fragments.clear()
-            self._notify_change()
+            self._snapshot = None
+            self._plain_text = ""
+            self._plain_count = 0
+            self._on_change()
 
     @property
     def is_empty(self) -> bool:
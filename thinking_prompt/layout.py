@@ -264,8 +264,7 @@ def create_history_window(
         if current_len > last_history_len[0]:
             # New content added - scroll to bottom
             last_history_len[0] = current_len
-            text = history.get_formatted_text()
-            line_count = sum(1 for _, t in text for c in t if c == '\n')
+            line_count = history.plain_text.count('\n')
             return Point(x=0, y=max(0, line_count - 1))
         # No new content - return None to preserve scroll position
         return None
@@ -9,13 +9,14 @@ from __future__ import annotations
 
 import asyncio
 import threading
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncIterator,
     Callable,
     Coroutine,
+    Iterator,
     Literal,
     Optional,
     Sequence,
@@ -31,7 +32,7 @@ from prompt_toolkit.application import Application
 from prompt_toolkit.buffer import Buffer
 from prompt_toolkit.completion import Completer
 from prompt_toolkit.enums import DEFAULT_BUFFER, EditingMode
-from prompt_toolkit.filters import Condition, has_focus
+from prompt_toolkit.filters import Condition, FilterOrBool, has_focus
 from prompt_toolkit.formatted_text import AnyFormattedText, FormattedText
 from prompt_toolkit.history import History, InMemoryHistory
 from prompt_toolkit.key_binding import KeyBindings, merge_key_bindings
@@ -95,13 +96,14 @@ class ThinkingPromptSession:
         styles: Optional[ThinkingPromptStyles] = None,
         history: Optional[History] = None,
         completer: Optional[Completer] = None,
-        complete_while_typing: bool = False,
+        complete_while_typing: FilterOrBool = False,
         completions_menu_height: int = 5,
         editing_mode: EditingMode = EditingMode.EMACS,
         max_thinking_height: int = 15,
         enable_status_bar: bool = True,
         status_text: AnyFormattedText = "Ctrl+C: cancel | Ctrl+D: exit",
         echo_input: bool = True,
+        refresh_interval: float = 0.1,
     ) -> None:
         """
         Initialize the ThinkingPromptSession.
@@ -113,18 +115,27 @@ class ThinkingPromptSession:
             history: History object for input history.
             completer: Completer for input autocompletion.
             complete_while_typing: Show completions automatically while typing.
+                Accepts a filter, e.g. to only invoke the completer once the
+                input starts with a trigger character.
             completions_menu_height: Maximum height of completions dropdown menu.
             editing_mode: Editing mode (EMACS or VI).
             max_thinking_height: Max lines for collapsed thinking box (must be >= 2).
             enable_status_bar: Whether to show status bar.
             status_text: Text to display in status bar.
             echo_input: Whether to echo user input to console before thinking.
+            refresh_interval: Seconds between UI redraws while the thinking box
+                is showing. Content callbacks are polled at this rate, so
+                appending content never triggers a redraw by itself. Must be
+                positive: without periodic redraws the thinking box would freeze.
 
         Raises:
-            ValueError: If max_thinking_height is less than 2.
+            ValueError: If max_thinking_height is less than 2 or
+                refresh_interval is not positive.
         """
         if max_thinking_height < 2:
             raise ValueError("max_thinking_height must be at least 2")
+        if refresh_interval is None or not refresh_interval > 0:
+            raise ValueError("refresh_interval must be positive")
 
         self._message = message
         self._app_info = app_info
@@ -134,6 +145,7 @@ class ThinkingPromptSession:
         self._status_text = status_text
         self._editing_mode = editing_mode
         self._echo_input = echo_input
+        self._refresh_interval = refresh_interval
         self._completer = completer
         self._complete_while_typing = complete_while_typing
         self._completions_menu_height = completions_menu_height
@@ -142,6 +154,11 @@ class ThinkingPromptSession:
         self._is_fullscreen: bool = False
         self._fullscreen_lock = threading.RLock()
 
+        # Deferred invalidation state for batch()
+        self._batch_lock = threading.Lock()
+        self._batch_depth: int = 0
+        self._batch_invalidated: bool = False
+
         # Convert styles dataclass to prompt_toolkit Style
         self._style = self._styles.to_style()
 
@@ -207,7 +224,7 @@ class ThinkingPromptSession:
             text = buff.document.text
 
             # Add to input history (for up/down arrow)
-            if text.strip():
+            if text and not text.isspace():
                 self._input_history.append_string(text)
 
                 if self._echo_input:
@@ -269,7 +286,7 @@ class ThinkingPromptSession:
             editing_mode=self._editing_mode,
             full_screen=False,  # Start in normal mode, will be updated dynamically
             mouse_support=Condition(lambda: self._is_fullscreen),  # Only in fullscreen
-            refresh_interval=0.1,  # For real-time updates
+            refresh_interval=self._refresh_interval,  # Polls thinking content
         )
 
     def _create_key_bindings(self) -> KeyBindings:
@@ -324,6 +341,11 @@ class ThinkingPromptSession:
 
     def _invalidate(self) -> None:
         """Trigger UI refresh and update full_screen state."""
+        with self._batch_lock:
+            if self._batch_depth:
+                self._batch_invalidated = True
+                return
+
         if self.app:
             # Update full_screen based on state
             # prompt_toolkit handles alternate buffer switching automatically
@@ -332,6 +354,35 @@ class ThinkingPromptSession:
             if self.app.is_running:
                 self.app.invalidate()
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group several updates into a single UI refresh.
+
+        Refreshes requested inside the block are deferred and performed once
+        when the outermost batch exits. Output is still printed and added to
+        history immediately; only the redraw is coalesced.
+
+        Example:
+            async with session.thinking() as content:
+                with session.batch():
+                    content.append("Phase 2: Processing data\n")
+                    session.add_message("system", "Connected")
+                    session.add_success("Ready")
+        """
+        with self._batch_lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._batch_lock:
+                self._batch_depth -= 1
+                flush = self._batch_depth == 0 and self._batch_invalidated
+                if flush:
+                    self._batch_invalidated = False
+            if flush:
+                self._invalidate()
+
     # =========================================================================
     # Welcome Message
     # =========================================================================
@@ -410,7 +461,7 @@ class ThinkingPromptSession:
         should_echo = echo_to_console if echo_to_console is not None else self._echo_thinking
 
         # Output thinking content (truncated to console, full to history)
-        if full_content.strip():
+        if full_content and not full_content.isspace():
             self._display.thinking(
                 full_content,
                 truncate_lines=self._max_thinking_height,
@@ -711,9 +711,7 @@ class SettingsDialog(BaseDialog):
         self.top = top
 
         # Original values for change detection
-        self._original_values: dict[str, Any] = {}
-        for item in items:
-            self._original_values[item.key] = item.default
+        self._original_values: dict[str, Any] = {item.key: item.default for item in items}
 
         # Create controls
         self._controls: list[SettingControl] = []
@@ -812,12 +810,12 @@ class SettingsDialog(BaseDialog):
 
     def _get_changed_values(self) -> dict[str, Any]:
         """Return only values that differ from original."""
-        changed = {}
-        for control in self._controls:
-            key = control.item.key
-            if control.value != self._original_values.get(key):
-                changed[key] = control.value
-        return changed
+        original = self._original_values
+        return {
+            control.item.key: control.value
+            for control in self._controls
+            if control.value != original[control.item.key]
+        }
 
     def _on_save(self) -> None:
         """Handle save - return changed values."""
@@ -271,7 +271,7 @@ class ThinkingBoxControl(FormattedTextControl):
             Content string, possibly truncated with "...".
         """
         content = self.content
-        if not content or not content.strip():
+        if not content or content.isspace():
             return ""
 
         with self._lock:
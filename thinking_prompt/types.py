@@ -11,6 +11,7 @@ from typing import (
     Any,
     Awaitable,
     Callable,
+    Iterable,
     List,
     Literal,
     Tuple,
@@ -62,7 +63,8 @@ def truncate_to_lines(content: str, max_lines: int, suffix: str = "...") -> str:
     Returns:
         Truncated content with suffix if over limit, otherwise content.rstrip().
     """
-    lines = content.split('\n')
+    # Split no further than needed: one extra part means there was more
+    lines = content.split('\n', max_lines)
     if len(lines) > max_lines:
         return '\n'.join(lines[:max_lines]) + '\n' + suffix
     return content.rstrip()
@@ -91,6 +93,9 @@ class StreamingContent:
 
     def __init__(self) -> None:
         self._chunks: List[str] = []
+        # Text of the first _joined_count chunks, extended on read
+        self._joined = ""
+        self._joined_count = 0
         self._lock = threading.Lock()
 
     def append(self, chunk: str) -> None:
@@ -98,15 +103,47 @@ class StreamingContent:
         with self._lock:
             self._chunks.append(chunk)
 
+    def extend(self, chunks: Iterable[str]) -> None:
+        """Append several chunks at once (thread-safe)."""
+        with self._lock:
+            self._chunks.extend(chunks)
+
+    def replace_last(self, chunk: str) -> None:
+        """
+        Replace the most recently appended chunk (thread-safe).
+
+        Useful for progress lines that update in place: append the line
+        once, then replace it on each update. Appends if there is no
+        content yet.
+        """
+        with self._lock:
+            if self._chunks:
+                self._chunks[-1] = chunk
+                # The joined prefix may include the old chunk; rebuild it
+                self._joined = ""
+                self._joined_count = 0
+            else:
+                self._chunks.append(chunk)
+
     def get_content(self) -> str:
-        """Get the accumulated content (thread-safe)."""
+        """
+        Get the accumulated content (thread-safe).
+
+        The thinking box calls this on every refresh, so only chunks
+        appended since the last read are joined.
+        """
         with self._lock:
-            return "".join(self._chunks)
+            if self._joined_count < len(self._chunks):
+                self._joined += "".join(self._chunks[self._joined_count:])
+                self._joined_count = len(self._chunks)
+            return self._joined
 
     def clear(self) -> None:
         """Clear all accumulated content (thread-safe)."""
         with self._lock:
             self._chunks.clear()
+            self._joined = ""
+            self._joined_count = 0
 
     def __len__(self) -> int:
         """Return the number of chunks."""